@@ -1,17 +1,24 @@
 # backend/app/api/auth.py
 
+import uuid
 from datetime import timedelta
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_db
 from app.core.security import (
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
     create_access_token,
     get_current_user,
+    cache_current_user,
+    CurrentUser,
     ACCESS_TOKEN_EXPIRE_MINUTES,
+    DUMMY_PASSWORD_HASH,
 )
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserOut
@@ -24,33 +31,43 @@ router = APIRouter(
 
 # 회원가입
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def register_user(
+async def register_user(
     payload: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    existing = db.query(User).filter(User.email == payload.email).first()
-    if existing:
+    # 해싱(argon2)은 CPU 작업 → 스레드풀에서 돌려 이벤트 루프를 막지 않음
+    # (argon2-cffi 는 해싱 중 GIL 을 풀어서 여러 요청이 코어를 나눠 씀)
+    hashed_password = await run_in_threadpool(get_password_hash, payload.password)
+
+    # 중복 확인 SELECT 없이 INSERT ... ON CONFLICT (email) DO NOTHING RETURNING 한 번으로 처리
+    # - 동시에 같은 이메일로 가입해도 users.email UNIQUE 인덱스가 한 건만 통과시킴
+    result = await db.execute(
+        pg_insert(User)
+        .values(
+            email=payload.email,
+            username=payload.username,
+            hashed_password=hashed_password,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
+    )
+    user = result.scalar_one_or_none()
+    if user is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
 
-    user = User(
-        email=payload.email,
-        username=payload.username,
-        hashed_password=get_password_hash(payload.password),
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
     return user
 
 
 # ✅ JSON 로그인 -----------------------------
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     payload: UserLogin,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     JSON 바디 로그인:
@@ -59,19 +76,38 @@ def login(
       "password": "비번"
     }
     """
-    user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.hashed_password):
+    result = await db.execute(select(User).where(User.email == payload.email))
+    user = result.scalar_one_or_none()
+    # 유저가 없어도 더미 해시로 검증을 한 번 돌려서 두 실패 경로의 소요 시간을 맞춤
+    password_ok, new_hash = await run_in_threadpool(
+        verify_and_update_password,
+        payload.password,
+        user.hashed_password if user else DUMMY_PASSWORD_HASH,
+    )
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # 예전 pbkdf2_sha256 해시 → 평문을 알고 있는 지금 argon2 로 교체
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    jti = uuid.uuid4().hex
     access_token = create_access_token(
-        data={"sub": str(user.id)},
+        data={"sub": str(user.id), "jti": jti},
         expires_delta=access_token_expires,
     )
+    # 토큰 발급 시점에 유저 정보를 캐시해 두면 이후 요청은 DB 조회 없이 인증
+    await cache_current_user(
+        jti,
+        CurrentUser.from_user(user),
+        int(access_token_expires.total_seconds()),
+    )
 
     return Token(
         access_token=access_token,
@@ -81,5 +117,5 @@ def login(
 
 # 내 정보
 @router.get("/me", response_model=UserOut)
-def read_me(current_user: User = Depends(get_current_user)):
+async def read_me(current_user: CurrentUser = Depends(get_current_user)):
     return current_user
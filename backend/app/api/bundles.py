@@ -1,23 +1,52 @@
 # app/api/bundles.py
 
+import asyncio
+import hashlib
 import logging
+import re
+import time
+from datetime import datetime, timezone
 import os
-import json
-from typing import List, Optional, Dict
-from uuid import UUID
+from typing import List, Optional, Dict, Tuple
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Header
-from openai import OpenAI
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, Query, Response
+from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
-
-from app.core.db import get_db
+from sqlalchemy import func, select, delete, exists, insert, literal, update, tuple_
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.cache import cache_get, cache_set
+from app.core.context_cache import forget_memory_context
+from app.core.db import get_db, AsyncSessionLocal
+from app.core.http import get_openai_client
+from app.models.auto_group_job import AutoGroupJob
 from app.models.bundle import Bundle
 from app.models.memory_item import MemoryItem
-from app.schemas.bundle import BundleCreate, BundleOut
-from app.schemas.memory import MemoryFromBlockCreate, MemoryItemOut
-from app.core.security import get_current_user
-from app.models.user import User
+from app.schemas.bundle import BundleCreate, BundleOut, BundlePage, BundleTreeOut
+from app.schemas.memory import (
+    MemoryBulkCreateOut,
+    MemoryFromBlockCreate,
+    MemoryItemOut,
+    MemoryItemPage,
+    SummaryBatchSyncOut,
+)
+from app.core.security import get_current_user, CurrentUser
+from app.llm import semantic_cache
+from app.llm.batch import BATCH_FAILED_STATUSES, fetch_batch_result, submit_chat_batch
+from app.llm.microbatch import MicroBatcher
+from app.llm.tokens import truncate_middle
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
 
 logger = logging.getLogger("app.bundles")
 
@@ -47,11 +76,11 @@ else:
 def build_openai_client(
     user_api_key: Optional[str],
     shared_api_password: Optional[str],
-) -> Optional[OpenAI]:
+) -> Optional[AsyncOpenAI]:
     # 1) 사용자 개인 키
     if user_api_key:
         try:
-            return OpenAI(api_key=user_api_key)
+            return get_openai_client(user_api_key)
         except Exception as e:
             logger.warning("[bundles] invalid user OpenAI key: %r", e)
 
@@ -66,64 +95,346 @@ def build_openai_client(
             logger.info(
                 "[bundles] using SERVER shared OPENAI_API_KEY via password."
             )
-            return OpenAI(api_key=OPENAI_API_KEY)
+            return get_openai_client(OPENAI_API_KEY)
         except Exception as e:
             logger.warning("[bundles] failed to build shared OpenAI client: %r", e)
 
     return None
 
-def summarize_for_memory(
+# 요약 모델 / 프롬프트 버전 (프롬프트를 바꾸면 버전도 올려서 예전 캐시를 무효화)
+SUMMARY_MODEL = "gpt-4.1-mini"
+
+# 입력 길이별 모델 라우팅 (요약/제목 공용)
+# - SUMMARY_LLM_MIN_CHARS 미만: LLM 없이 원문(요약) / 첫 줄(제목)
+# - SUMMARY_LIGHT_MAX_CHARS 미만: 더 싸고 빠른 모델
+# - 그 이상: SUMMARY_MODEL
+SUMMARY_LLM_MIN_CHARS = 200
+SUMMARY_LIGHT_MAX_CHARS = 1000
+SUMMARY_LIGHT_MODEL = "gpt-4o-mini"
+SUMMARY_PROMPT_VERSION = "v2"
+
+# 고정 지시문은 전부 system 메시지 하나에 두고, 원문은 맨 뒤 user 메시지로만 보냄
+# → 요청마다 앞부분(prefix)이 완전히 같아서 OpenAI 프롬프트 캐시가 재사용 가능
+SUMMARY_SYSTEM_PROMPT = (
+    "당신은 사용자의 대화/노트를 장기 기억용으로 요약하는 비서입니다.\n"
+    "사용자 메시지로 받은 텍스트 전체를 나중에 다시 사용할 수 있는 '장기 기억 메모'로 요약하세요.\n"
+    "- 핵심 내용만 3~6줄 정도로 정리\n"
+    "- 중요한 사람/장소/목표/결론이 있으면 꼭 포함\n"
+    "- 한국어로 답변\n"
+    "- 요약문만 출력 (머리말/설명 없이)"
+)
+SUMMARY_SYSTEM_MESSAGE = {"role": "system", "content": SUMMARY_SYSTEM_PROMPT}
+
+# 메모 제목 생성 (요약과 같은 방식: 고정 지시문은 system 에만, user 메시지는 원문만)
+TITLE_SYSTEM_PROMPT = (
+    "너는 사용자의 메모에 붙일 짧은 제목을 만드는 비서야.\n"
+    "사용자 메시지로 받은 전체 대화/텍스트의 내용을 대표하는 **아주 짧은 제목**을 만들어 주세요.\n"
+    "- 한국어로 1~6단어 정도\n"
+    "- 따옴표나 마침표 없이, 제목만 출력\n"
+    "- 예시: 인사, 중국 음식, 시험 계획, 프로젝트 회의 메모"
+)
+TITLE_SYSTEM_MESSAGE = {"role": "system", "content": TITLE_SYSTEM_PROMPT}
+
+# 제목은 앞/뒤만 봐도 충분해서 요약보다 입력 상한을 작게
+TITLE_MAX_INPUT_TOKENS = 2000
+TITLE_PROMPT_VERSION = "v2"
+
+# 요약 입력 상한 (토큰). 넘으면 앞/뒤 절반씩만 보내서 비용/지연을 고정
+SUMMARY_MAX_INPUT_TOKENS = 6000
+
+# 같은 원문 요약/제목 재사용 (Redis, key = sum:|title:{blake2b(모델|프롬프트 버전|원문)})
+SUMMARY_CACHE_TTL_SECONDS = 60 * 60 * 24 * 30
+
+# 이 정도로 짧고 대화 형식이 아닌 메모는 이미 요약 같은 글이라 원문을 그대로 사용
+SUMMARY_PASSTHROUGH_MAX_CHARS = 300
+SUMMARY_PASSTHROUGH_MAX_NEWLINES = 3
+DIALOGUE_MARKERS = ("사용자:", "User:", "LLM:", "Assistant:")
+# 짧은 글머리표 목록은 줄 수가 많아도 이미 요약 형태라 그대로 사용
+BULLET_PREFIXES = ("- ", "* ", "• ", "· ")
+BULLET_NUMBERED_RE = re.compile(r"\d+[.)]\s")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# 여러 메모를 한 번에 저장할 때는 요약을 OpenAI Batch API 로 넘김 (비용 50%)
+# - 결과는 최대 24시간 뒤라서 응답에는 summary_status='pending' 으로 나감
+SUMMARY_BATCH_MIN_ITEMS = 2
+SUMMARY_BATCH_POLL_SECONDS = 60
+SUMMARY_BATCH_MAX_WAIT_SECONDS = 60 * 60 * 25
+
+# Batch API 를 안 쓸 때(use_batch=false, 1건, 제출 실패) 동시에 돌릴 요약 호출 수
+SUMMARY_CONCURRENCY = 16
+
+# 거의 동시에 들어온 여러 메모 요약 (다른 요청에서 연달아 저장 등) 은 한 호출로 묶음
+# - 같은 클라이언트(키) + 같은 유저 기준, 50ms 안에 모인 것 최대 8개
+#   (공유 키를 쓰는 서로 다른 유저의 메모가 한 프롬프트에 섞이지 않게)
+# - 1건이면 평소와 같은 단건 요약 요청
+SUMMARY_MICROBATCH_MAX_ITEMS = 8
+SUMMARY_MICROBATCH_WINDOW_SECONDS = 0.05
+SUMMARY_MULTI_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        SUMMARY_SYSTEM_PROMPT
+        + "\n여러 텍스트가 [번호] 와 함께 주어지면 각각 따로 요약해서, "
+        "번호(index)별로 summaries 배열에 담아 반환하세요."
+    ),
+}
+SUMMARY_MULTI_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "summaries",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summaries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "index": {"type": "integer"},
+                            "summary": {"type": "string"},
+                        },
+                        "required": ["index", "summary"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["summaries"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def summary_model_for(text: str) -> str:
+    """요약/제목에 쓸 모델 (짧은 입력은 가벼운 모델)."""
+    return SUMMARY_LIGHT_MODEL if len(text) < SUMMARY_LIGHT_MAX_CHARS else SUMMARY_MODEL
+
+
+def _summary_cache_key(text: str) -> str:
+    return "sum:" + _text_hash(f"{summary_model_for(text)}|{SUMMARY_PROMPT_VERSION}|{text}")
+
+
+def _title_cache_key(text: str) -> str:
+    return "title:" + _text_hash(f"{summary_model_for(text)}|{TITLE_PROMPT_VERSION}|{text}")
+
+
+def _looks_like_summary(text: str) -> bool:
+    # 길이/줄 수는 HTML 태그, 연속 공백, 빈 줄을 뺀 실제 내용 기준
+    lines = [
+        " ".join(line.split())
+        for line in HTML_TAG_RE.sub(" ", text).splitlines()
+    ]
+    lines = [line for line in lines if line]
+    if sum(len(line) for line in lines) >= SUMMARY_PASSTHROUGH_MAX_CHARS:
+        return False
+    if any(marker in text for marker in DIALOGUE_MARKERS):
+        return False
+    bulleted = all(
+        line.startswith(BULLET_PREFIXES) or BULLET_NUMBERED_RE.match(line)
+        for line in lines
+    )
+    return bulleted or len(lines) - 1 <= SUMMARY_PASSTHROUGH_MAX_NEWLINES
+
+
+async def lookup_summary_without_llm(original_text: str) -> Optional[str]:
+    """
+    LLM 호출 없이 바로 정해지는 요약.
+    - 짧은 일반 메모 → 원문 그대로
+    - 정확히 같은 원문(모델/프롬프트 버전까지 같음)을 요약한 적 있음 → 캐시된 요약
+    - 나머지는 None (LLM 요약 필요)
+    """
+    text = original_text.strip()
+    if len(text) < SUMMARY_LLM_MIN_CHARS or _looks_like_summary(text):
+        # 짧은 텍스트는 그냥 원문을 요약으로 사용 (요약해도 원문보다 길어짐)
+        return text
+
+    cached = await cache_get(_summary_cache_key(text))
+    if cached:
+        logger.info("[bundles] summarization cache hit. len(original)=%d", len(text))
+    return cached
+
+
+# 진행 중인 요약 ((client, user_id, 캐시 key) → 결과 future), 같은 원문 동시 요약 합치기용
+# - 유저/키가 다르면 합치지 않음 (다른 유저의 API 키·semantic 캐시를 타지 않게)
+_inflight_summaries: Dict[Tuple[AsyncOpenAI, Optional[UUID], str], asyncio.Future] = {}
+
+
+def summary_request_body(text: str) -> dict:
+    """
+    요약용 chat.completions 파라미터 (즉시 호출/Batch API 공용).
+    - 아주 긴 붙여넣기(로그 등)는 앞/뒤만 남겨 입력 토큰을 SUMMARY_MAX_INPUT_TOKENS 로 제한
+    """
+    return {
+        "model": summary_model_for(text),
+        "messages": [
+            SUMMARY_SYSTEM_MESSAGE,
+            {"role": "user", "content": truncate_middle(text, SUMMARY_MAX_INPUT_TOKENS)},
+        ],
+        "max_tokens": 256,
+        "temperature": 0.3,
+    }
+
+
+async def _request_summary(client: AsyncOpenAI, text: str) -> Optional[str]:
+    """단건 요약 호출. 실패하면 None."""
+    try:
+        resp = await client.chat.completions.create(**summary_request_body(text))
+        return (resp.choices[0].message.content or "").strip()
+    except Exception as e:
+        logger.warning("[bundles] summarization failed: %r", e)
+        return None
+
+
+async def _summarize_texts(
+    key: Tuple[AsyncOpenAI, str, UUID],
+    texts: List[str],
+) -> List[Optional[str]]:
+    """
+    MicroBatcher handler: 모인 원문들을 요약 호출 한 번으로 처리 (texts 와 같은 순서로 반환).
+    - key = (client, model, user_id): 키/모델/유저가 같은 원문끼리만 한 호출로 묶음
+    - 응답에서 빠진 번호가 있거나 호출이 실패하면 그 원문만 단건 요약으로 다시 시도
+    """
+    client, model, _user_id = key
+    if len(texts) == 1:
+        return [await _request_summary(client, texts[0])]
+
+    numbered = "\n\n".join(
+        f"[{i}]\n{truncate_middle(t, SUMMARY_MAX_INPUT_TOKENS)}" for i, t in enumerate(texts)
+    )
+    by_index: Dict[int, str] = {}
+    try:
+        resp = await client.chat.completions.create(
+            model=model,
+            messages=[
+                SUMMARY_MULTI_SYSTEM_MESSAGE,
+                {"role": "user", "content": numbered},
+            ],
+            response_format=SUMMARY_MULTI_RESPONSE_FORMAT,
+            max_tokens=256 * len(texts),
+            temperature=0.3,
+        )
+        for item in orjson.loads(resp.choices[0].message.content or "{}").get("summaries", []):
+            summary = str(item.get("summary", "")).strip()
+            if summary:
+                by_index[int(item["index"])] = summary
+    except Exception as e:
+        logger.warning("[bundles] multi summarization failed (items=%d): %r", len(texts), e)
+
+    missing = [i for i in range(len(texts)) if i not in by_index]
+    if missing:
+        retried = await asyncio.gather(*(_request_summary(client, texts[i]) for i in missing))
+        by_index.update(zip(missing, retried))
+
+    logger.info(
+        "[bundles] micro-batched summarization. items=%d retried=%d",
+        len(texts),
+        len(missing),
+    )
+    return [by_index.get(i) for i in range(len(texts))]
+
+
+_summary_batcher = MicroBatcher(
+    _summarize_texts,
+    max_items=SUMMARY_MICROBATCH_MAX_ITEMS,
+    window_seconds=SUMMARY_MICROBATCH_WINDOW_SECONDS,
+)
+
+
+async def summarize_for_memory(
     original_text: str,
-    client: Optional[OpenAI],
+    client: Optional[AsyncOpenAI],
+    user_id: Optional[UUID] = None,
 ) -> Optional[str]:
     """
     MemoryItem.summary에 넣을 요약을 생성.
+    - 짧은 일반 메모는 원문 그대로, 같은 원문은 캐시된 요약 재사용
+    - user_id 가 있으면 그 유저의 거의 같은 원문 요약도 재사용 (semantic 캐시)
     - 실패해도 예외를 위로 올리지 않고 None 반환
     """
     if client is None:
         # 키가 없으면 요약 생략
         return None
 
-    text = original_text.strip()
-    if len(text) < 40:
-        # 짧은 텍스트는 그냥 원문을 요약으로 사용
-        return text
+    known = await lookup_summary_without_llm(original_text)
+    if known is not None:
+        return known
 
+    text = original_text.strip()
+    cache_key = _summary_cache_key(text)
+
+    # 같은 유저의 같은 원문 요약이 이미 진행 중이면 (같은 블록을 여러 번들에 동시에 저장 등)
+    # LLM 을 한 번 더 부르지 않고 그 결과를 같이 기다림
+    # - 이벤트 루프 하나 안에서 get → 등록 사이에 await 가 없으므로 lock 불필요
+    # - shield: 기다리던 쪽 요청이 취소돼도 공유 future 는 취소되지 않게
+    inflight_key = (client, user_id, cache_key)
+    inflight = _inflight_summaries.get(inflight_key)
+    if inflight is not None:
+        logger.info("[bundles] summarization coalesced with in-flight call")
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight_summaries[inflight_key] = future
+    summary: Optional[str] = None
     try:
-        prompt = (
-            "다음 텍스트를 나중에 다시 사용할 수 있는 '장기 기억 메모'로 요약해줘.\n"
-            "- 핵심 내용만 3~6줄 정도로 정리\n"
-            "- 중요한 사람/장소/목표/결론이 있으면 꼭 포함\n"
-            "- 한국어로 답변\n\n"
-            f"--- 원문 ---\n{text}\n"
-        )
-
-        resp = client.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 사용자의 대화/노트를 장기 기억용으로 요약하는 비서입니다.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=256,
-            temperature=0.3,
-        )
-        summary = (resp.choices[0].message.content or "").strip()
-        logger.info(
-            "[bundles] summarization success. len(original)=%d len(summary)=%d",
-            len(text),
-            len(summary),
-        )
+        summary = await _summarize_with_llm(text, cache_key, client, user_id)
         return summary
+    finally:
+        _inflight_summaries.pop(inflight_key, None)
+        future.set_result(summary)
+
+
+async def _summarize_with_llm(
+    text: str,
+    cache_key: str,
+    client: AsyncOpenAI,
+    user_id: Optional[UUID],
+) -> Optional[str]:
+    """캐시에 없는 원문 요약 (semantic 캐시 → LLM 호출 → 두 캐시에 저장)."""
+    # 약간 고친 같은 메모 → 임베딩 1번 + 최근접 검색으로 요약 생성 대신 재사용
+    embedding = None
+    if user_id is not None and semantic_cache.is_enabled():
+        embedding = await semantic_cache.embed_text(client, text)
+        if embedding is not None:
+            similar = await semantic_cache.find_similar_summary(user_id, embedding)
+            if similar:
+                # 정확 캐시(key 가 원문만으로 정해짐, 전 유저 공용)에는 넣지 않음
+                # → 이 요약은 이 유저의 다른(비슷한) 원문 요약이라 다른 유저에게 나가면 안 됨
+                return similar
+
+    try:
+        if user_id is None:
+            # 누구의 메모인지 모르면 다른 원문과 묶지 않고 단건 요약
+            summary = await _request_summary(client, text)
+        else:
+            summary = await _summary_batcher.submit(
+                (client, summary_model_for(text), user_id), text
+            )
     except Exception as e:
         logger.warning("[bundles] summarization failed: %r", e)
         return None
+    if summary is None:
+        return None
+
+    logger.info(
+        "[bundles] summarization success. len(original)=%d len(summary)=%d",
+        len(text),
+        len(summary),
+    )
+    if summary:
+        await cache_set(cache_key, summary, SUMMARY_CACHE_TTL_SECONDS)
+        if embedding is not None:
+            await semantic_cache.store_summary(
+                user_id, _text_hash(text), embedding, summary
+            )
+    return summary
 
-def generate_memory_title(
+async def generate_memory_title(
     original_text: str,
-    client: Optional[OpenAI],
+    client: Optional[AsyncOpenAI],
 ) -> str:
     """
     메모 제목용 짧은 키워드 생성.
@@ -144,26 +455,22 @@ def generate_memory_title(
         first_line = first_line or "메모"
         return first_line[:20] + ("…" if len(first_line) > 20 else "")
 
-    # LLM 키 없으면 바로 fallback
-    if client is None:
+    # LLM 키 없거나 짧은 메모는 첫 줄이 곧 제목 → 바로 fallback
+    if client is None or len(text) < SUMMARY_LLM_MIN_CHARS:
         return simple_fallback()
 
+    cache_key = _title_cache_key(text)
+    cached = await cache_get(cache_key)
+    if cached:
+        logger.info("[bundles] title cache hit. len(original)=%d", len(text))
+        return cached
+
     try:
-        prompt = (
-            "다음 전체 대화/텍스트의 내용을 대표하는 **아주 짧은 제목**을 만들어 주세요.\n"
-            "- 한국어로 1~6단어 정도\n"
-            "- 따옴표나 마침표 없이, 제목만 출력\n"
-            "- 예시: 인사, 중국 음식, 시험 계획, 프로젝트 회의 메모\n\n"
-            f"--- 내용 ---\n{text}\n"
-        )
-        resp = client.chat.completions.create(
-            model="gpt-4.1-mini",
+        resp = await client.chat.completions.create(
+            model=summary_model_for(text),
             messages=[
-                {
-                    "role": "system",
-                    "content": "너는 사용자의 메모에 붙일 짧은 제목을 만드는 비서야.",
-                },
-                {"role": "user", "content": prompt},
+                TITLE_SYSTEM_MESSAGE,
+                {"role": "user", "content": truncate_middle(text, TITLE_MAX_INPUT_TOKENS)},
             ],
             max_tokens=32,
             temperature=0.3,
@@ -172,11 +479,142 @@ def generate_memory_title(
         # 너무 길거나 이상하면 fallback
         if not title or len(title) > 30:
             return simple_fallback()
+        await cache_set(cache_key, title, SUMMARY_CACHE_TTL_SECONDS)
         return title
     except Exception as e:
         logger.warning("[bundles] title generation failed: %r", e)
         return simple_fallback()
 
+async def summarize_and_store(
+    memory_id: UUID,
+    user_id: UUID,
+    original_text: str,
+    client: Optional[AsyncOpenAI],
+) -> None:
+    """
+    BackgroundTasks 용: 응답을 보낸 뒤 요약을 만들어 memory_items.summary 에 저장.
+    - 요청 세션은 이미 닫혔으므로 자체 세션 사용
+    - 실패해도 예외를 위로 올리지 않음 (summary 는 None, summary_status='failed')
+    - 프론트는 GET /bundles/{bundle_id}/memories/{memory_id} 로 summary_status 확인
+    """
+    summary = await summarize_for_memory(original_text, client, user_id)
+    values = (
+        {"summary": summary, "summary_status": "done"}
+        if summary
+        else {"summary_status": "failed"}
+    )
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(MemoryItem)
+                .where(MemoryItem.id == memory_id)
+                .values(**values)
+            )
+            await db.commit()
+        if summary:
+            await forget_memory_context(user_id)
+    except Exception as e:
+        logger.warning("[bundles] storing summary failed (memory_id=%s): %r", memory_id, e)
+
+
+async def summarize_and_store_many(
+    items: List[Tuple[UUID, str]],
+    user_id: UUID,
+    client: AsyncOpenAI,
+) -> None:
+    """
+    BackgroundTasks 용: (memory_id, 원문) 여러 개를 동시에 요약해서 저장.
+    - BackgroundTasks 는 태스크를 하나씩 순서대로 실행하므로, 메모별로 따로 넣으면
+      N × LLM 지연이 됨 → 한 태스크 안에서 gather (동시 호출 수는 SUMMARY_CONCURRENCY)
+    """
+    sem = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+
+    async def one(memory_id: UUID, original_text: str) -> None:
+        async with sem:
+            await summarize_and_store(memory_id, user_id, original_text, client)
+
+    await asyncio.gather(*(one(mid, text) for mid, text in items))
+
+
+async def apply_summary_batch_result(
+    batch_id: str,
+    user_id: UUID,
+    client: AsyncOpenAI,
+) -> Tuple[str, int]:
+    """
+    요약 배치 결과를 memory_items 에 반영하고 (배치 상태, 반영한 행 수) 반환.
+    - custom_id = memory_id, 다른 유저의 메모는 건드리지 않도록 user_id 도 조건에 넣음
+    - 실패/만료된 배치나 응답이 없는 요청은 summary_status='failed'
+    """
+    result = await fetch_batch_result(client, batch_id)
+    if not result.finished:
+        return result.status, 0
+
+    done_rows = [
+        {"id": UUID(custom_id), "summary": content.strip(), "summary_status": "done"}
+        for custom_id, content in (result.outputs or {}).items()
+        if content and content.strip()
+    ]
+
+    async with AsyncSessionLocal() as db:
+        if done_rows:
+            # PK 기준 bulk UPDATE (executemany 한 번)
+            await db.execute(
+                update(MemoryItem).where(
+                    MemoryItem.user_id == user_id,
+                    MemoryItem.summary_batch_id == batch_id,
+                ),
+                done_rows,
+                execution_options={"synchronize_session": None},
+            )
+        # 결과가 없는 나머지 pending 행 정리 (배치 자체가 실패/만료된 경우 포함)
+        failed = await db.execute(
+            update(MemoryItem)
+            .where(
+                MemoryItem.user_id == user_id,
+                MemoryItem.summary_batch_id == batch_id,
+                MemoryItem.summary_status == "pending",
+            )
+            .values(summary_status="failed")
+        )
+        await db.commit()
+    if done_rows:
+        await forget_memory_context(user_id)
+
+    logger.info(
+        "[bundles] summary batch applied. batch_id=%s status=%s done=%d failed=%d",
+        batch_id,
+        result.status,
+        len(done_rows),
+        failed.rowcount,
+    )
+    return result.status, len(done_rows)
+
+
+async def poll_summary_batch(
+    batch_id: str,
+    user_id: UUID,
+    client: AsyncOpenAI,
+) -> None:
+    """
+    BackgroundTasks 용: 배치가 끝날 때까지 주기적으로 확인해서 결과 반영.
+    - 서버는 사용자 키를 저장하지 않으므로 요청 때 받은 client 를 메모리에 들고 있음
+    - 서버가 재시작되면 폴링이 끊기므로 POST /bundles/summary-batches/{id}/sync 로도 반영 가능
+    """
+    deadline = time.monotonic() + SUMMARY_BATCH_MAX_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            status, _ = await apply_summary_batch_result(batch_id, user_id, client)
+        except Exception as e:
+            logger.warning("[bundles] summary batch poll failed (batch_id=%s): %r", batch_id, e)
+            status = None
+        if status == "completed" or status in BATCH_FAILED_STATUSES:
+            return
+        await asyncio.sleep(SUMMARY_BATCH_POLL_SECONDS)
+
+    logger.warning("[bundles] summary batch poll timed out. batch_id=%s", batch_id)
+
 # -------------------------
 # Update/정리 Pydantic 모델
 # -------------------------
@@ -204,7 +642,7 @@ class MemoryUpdate(BaseModel):
 # 번들 자동 그룹핑용 스키마
 class AutoGroupCandidate(BaseModel):
     parent_name: str               # 새로 만들 상위 번들 이름 (예: "국가")
-    child_bundle_ids: List[str]    # 이 밑으로 들어갈 기존 번들 id 리스트 (UUID 문자열)
+    child_bundle_ids: List[UUID]   # 이 밑으로 들어갈 기존 번들 id 리스트 (요청 검증 때 한 번에 파싱)
 
 
 class AutoGroupPreviewResponse(BaseModel):
@@ -215,209 +653,518 @@ class AutoGroupApplyRequest(BaseModel):
     groups: List[AutoGroupCandidate]
 
 
+class AutoGroupJobOut(BaseModel):
+    job_id: UUID
+    status: str                                  # OpenAI batch 상태 (completed 면 groups 확정)
+    groups: Optional[List[AutoGroupCandidate]] = None
+
+
+# 번들 자동 정리 프롬프트
+# - 출력 형식은 response_format(json_schema, strict) 으로 강제하므로
+#   프롬프트에는 JSON 예시 / "JSON만 출력해" 같은 지시를 넣지 않음
+AUTO_GROUP_MODEL = "gpt-4.1-mini"
+AUTO_GROUP_SYSTEM_PROMPT = (
+    "당신은 사용자의 '번들(폴더)' 이름을 보고, 의미적으로 비슷한 번들을 "
+    "상위 카테고리로 묶어 주는 도우미입니다.\n"
+    "규칙:\n"
+    "- parent_name: 새로 만들 상위 번들 이름 (한국어 4~12자 정도의 명사구)\n"
+    "- children: 이 그룹에 넣을 기존 번들의 '이름' 문자열 리스트\n"
+    "- parent_name 에는 \"사용자:\", \"LLM:\" 과 같은 말하는 사람 접두어나 "
+    "이모지, 불필요한 기호를 넣지 말고, 콜론(:) 으로 끝나지 않게 할 것\n"
+    "- 애매하면 그룹을 만들지 말고, 소수의 그룹만 만들 것"
+)
+AUTO_GROUP_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "grouping",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "groups": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "parent_name": {"type": "string"},
+                            "children": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            },
+                        },
+                        "required": ["parent_name", "children"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["groups"],
+            "additionalProperties": False,
+        },
+    },
+}
+# 출력 상한. 번들이 많으면 children 이름만으로도 길어질 수 있어서 여유를 둠
+# (잘리면 JSON 이 깨져서 빈 결과가 되므로 더 줄이지 않음)
+AUTO_GROUP_MAX_TOKENS = 512
+# 프롬프트나 로컬 그룹핑 규칙이 바뀌면 올림 (캐시된 미리보기 무효화)
+AUTO_GROUP_PROMPT_VERSION = "v3"
+
+# 미리보기 결과 재사용 (key = ag:{blake2b(모델|프롬프트 버전|정렬된 번들 이름들)})
+AUTO_GROUP_CACHE_TTL_SECONDS = 60 * 60
+
+# 미리보기 LLM 호출 1번에 넣는 번들 이름 수 (넘으면 나눠서 동시에 호출)
+# - 한 번에 수백 개를 넣으면 출력이 max_tokens 에 잘리거나 품질이 떨어짐
+AUTO_GROUP_SHARD_SIZE = 50
+
+# 로컬 그룹핑에서 공통 단어로 인정하는 최소 글자 수 (한 글자 조사/기호 제외)
+AUTO_GROUP_LOCAL_MIN_WORD_CHARS = 2
+
+# 로컬 그룹으로 인정하려면 공통 단어가 각 이름 단어의 과반이어야 함
+# - "2024 회의" / "2024 여행", "메모 ..." 처럼 단어 하나만 겹치는 건 애매 → LLM 에 넘김
+AUTO_GROUP_LOCAL_MIN_SHARED_RATIO = 0.5
+
+# /auto-group/schedule: 같은 요청을 Batch API 로 보내서 (비용 50%) 나중에 결과 조회
+AUTO_GROUP_JOB_POLL_SECONDS = 60
+AUTO_GROUP_JOB_MAX_WAIT_SECONDS = 60 * 60 * 25
+
+
+def auto_group_request_body(bundles: List[Row]) -> dict:
+    """번들 목록으로 자동 정리용 chat.completions 요청 body 생성."""
+    # LLM에 넘길 번들 리스트 (이름 기준으로 묶게 시킴)
+    # - 응답 children 도 이름이라 id 는 안 보냄 (UUID 는 토큰을 많이 먹음)
+    # - JSON 배열 대신 한 줄에 이름 하나, 같은 이름은 한 번만
+    names = "\n".join(dict.fromkeys(b.name for b in bundles))
+    return {
+        "model": AUTO_GROUP_MODEL,
+        "messages": [
+            {"role": "system", "content": AUTO_GROUP_SYSTEM_PROMPT},
+            {"role": "user", "content": "번들 목록:\n" + names},
+        ],
+        "response_format": AUTO_GROUP_RESPONSE_FORMAT,
+        "max_tokens": AUTO_GROUP_MAX_TOKENS,
+        "temperature": 0.2,
+    }
+
+
+def build_auto_group_candidates(obj: dict, bundles: List[Row]) -> List[AutoGroupCandidate]:
+    """LLM 응답({groups: [{parent_name, children(이름)}]})을 번들 id 기준 그룹으로 변환."""
+    # 번들 "이름" → id 리스트 매핑 (같은 이름 여러 개 대비)
+    name_to_ids: Dict[str, List[UUID]] = {}
+    for b in bundles:
+        name_to_ids.setdefault(b.name, []).append(b.id)
+
+    groups: List[AutoGroupCandidate] = []
+    for g in obj.get("groups", []):
+        parent_name = str(g.get("parent_name", "")).strip()
+        if not parent_name:
+            continue
+
+        children_names = g.get("children", [])
+        if not isinstance(children_names, list):
+            continue
+
+        child_bundle_ids: List[UUID] = []
+        for cname in children_names:
+            cname_str = str(cname).strip()
+            if not cname_str:
+                continue
+            # 같은 이름 번들이 여러 개 있을 수도 있으니 전부 추가
+            child_bundle_ids.extend(name_to_ids.get(cname_str, []))
+
+        # 실제로 매핑된 번들이 있어야 유효 그룹
+        if not child_bundle_ids:
+            continue
+
+        groups.append(
+            AutoGroupCandidate(
+                parent_name=parent_name,
+                child_bundle_ids=child_bundle_ids,
+            )
+        )
+    return groups
+
+
+def _auto_group_cache_key(names: List[str]) -> str:
+    joined = "\n".join(sorted(names))
+    return "ag:" + _text_hash(f"{AUTO_GROUP_MODEL}|{AUTO_GROUP_PROMPT_VERSION}|{joined}")
+
+
+def local_auto_group(names: List[str]) -> Tuple[List[dict], List[str]]:
+    """
+    LLM 없이 확실한 그룹만 먼저 묶음 → (groups, 남은 이름들).
+    - 공통 단어가 각 이름 단어의 과반인 이름끼리만 묶고, 단어를 이어서 parent_name
+      (예: "프로젝트 회의 A", "프로젝트 회의 B" → "프로젝트 회의")
+    - 단어 하나만 겹치는 경우 ("한국 음식" / "일본 음식", "2024 회의" / "2024 여행") 는
+      의미로 판단해야 하므로 LLM 에 넘김
+    - 한 이름이 서로 다른 그룹에 걸치면 애매하므로 로컬에서는 묶지 않고 LLM 에 넘김
+    groups 는 LLM 응답과 같은 형식 ({parent_name, children: 이름 리스트})
+    """
+    word_to_names: Dict[str, List[str]] = {}
+    for name in names:
+        for word in dict.fromkeys(name.split()):
+            if len(word) >= AUTO_GROUP_LOCAL_MIN_WORD_CHARS:
+                word_to_names.setdefault(word, []).append(name)
+
+    # 같은 이름 집합을 공유하는 단어들은 한 그룹으로
+    words_by_members: Dict[frozenset, List[str]] = {}
+    for word, members in word_to_names.items():
+        if len(members) >= 2:
+            words_by_members.setdefault(frozenset(members), []).append(word)
+
+    membership: Dict[str, int] = {}
+    for members in words_by_members:
+        for name in members:
+            membership[name] = membership.get(name, 0) + 1
+
+    groups: List[dict] = []
+    grouped: set = set()
+    for members, words in words_by_members.items():
+        if any(membership[name] > 1 for name in members):
+            continue
+        if any(
+            len(words) <= len(dict.fromkeys(name.split())) * AUTO_GROUP_LOCAL_MIN_SHARED_RATIO
+            for name in members
+        ):
+            continue
+        children = [name for name in names if name in members]
+        first_words = children[0].split()
+        parent_name = " ".join(sorted(words, key=first_words.index))
+        groups.append({"parent_name": parent_name, "children": children})
+        grouped.update(members)
+
+    return groups, [name for name in names if name not in grouped]
+
+
+async def load_auto_group_bundles(db: AsyncSession, user_id: UUID) -> List[Row]:
+    """
+    자동 정리 대상 번들 (보관 안 된 것, 오래된 순).
+    - 이름 → id 매핑에만 쓰므로 (id, name) 만 읽음 (ORM 객체/나머지 컬럼 생략)
+    """
+    result = await db.execute(
+        select(Bundle.id, Bundle.name)
+        .where(
+            Bundle.user_id == user_id,
+            Bundle.is_archived == False,  # noqa: E712
+        )
+        .order_by(Bundle.created_at.asc())
+    )
+    return result.all()
+
+
+async def sync_auto_group_job(
+    job_id: UUID,
+    user_id: UUID,
+    client: AsyncOpenAI,
+) -> Optional[AutoGroupJob]:
+    """
+    자동 정리 배치 상태를 확인해서 job 에 반영하고 job 반환 (없거나 남의 job 이면 None).
+    - 완료되면 그 시점의 번들 목록 기준으로 이름 → id 매핑해서 groups 저장
+      (제출 후 삭제된 번들은 자연스럽게 빠짐)
+    """
+    async with AsyncSessionLocal() as db:
+        job = await db.get(AutoGroupJob, job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        if job.batch_id is None or job.status == "completed" or job.status in BATCH_FAILED_STATUSES:
+            return job
+
+        result = await fetch_batch_result(client, job.batch_id)
+        job.status = result.status
+        if result.status == "completed":
+            raw = (result.outputs or {}).get(str(job.id))
+            groups: List[AutoGroupCandidate] = []
+            if raw:
+                try:
+                    bundles = await load_auto_group_bundles(db, user_id)
+                    groups = build_auto_group_candidates(orjson.loads(raw), bundles)
+                except Exception as e:
+                    logger.warning("[auto_group_job] build groups failed (job_id=%s): %r", job_id, e)
+            job.groups = [g.model_dump(mode="json") for g in groups]
+
+        await db.commit()
+
+    logger.info("[auto_group_job] synced job_id=%s status=%s", job_id, job.status)
+    return job
+
+
+async def poll_auto_group_job(
+    job_id: UUID,
+    user_id: UUID,
+    client: AsyncOpenAI,
+) -> None:
+    """
+    BackgroundTasks 용: 배치가 끝날 때까지 주기적으로 확인 (poll_summary_batch 와 같은 방식).
+    - 서버가 재시작되면 폴링이 끊기지만 GET /bundles/auto-group/result/{job_id} 가 직접 확인함
+    """
+    deadline = time.monotonic() + AUTO_GROUP_JOB_MAX_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            job = await sync_auto_group_job(job_id, user_id, client)
+        except Exception as e:
+            logger.warning("[auto_group_job] poll failed (job_id=%s): %r", job_id, e)
+            job = None
+        if job is None or job.status == "completed" or job.status in BATCH_FAILED_STATUSES:
+            return
+        await asyncio.sleep(AUTO_GROUP_JOB_POLL_SECONDS)
+
+    logger.warning("[auto_group_job] poll timed out. job_id=%s", job_id)
+
+
 # -------------------------
-# Helper: MemoryItem → MemoryItemOut
+# Helper: 번들 소유 확인
 # -------------------------
 
 
-def memory_to_out(m: MemoryItem) -> MemoryItemOut:
-    return MemoryItemOut(
-        id=m.id,
-        user_id=m.user_id,
-        bundle_id=m.bundle_id,
-        title=m.title,
-        summary=m.summary,
-        original_text=m.original_text,
-        source_type=m.source_type,
-        source_id=m.source_id,
-        metadata=m.metadata_json or {},
-        is_pinned=m.is_pinned,
-        usage_count=m.usage_count,
-        last_used_at=m.last_used_at,
-        created_at=m.created_at,
-        updated_at=m.updated_at,
-    )
+async def get_owned_bundle(
+    db: AsyncSession,
+    user_id: UUID,
+    bundle_id: UUID,
+) -> Optional[Bundle]:
+    """
+    현재 유저 소유 번들 조회 (없거나 남의 번들이면 None).
+    - db.get 은 세션 identity map 을 먼저 보므로, 같은 요청(세션) 안에서
+      이미 읽은 번들은 다시 SELECT 하지 않음
+    """
+    bundle = await db.get(Bundle, bundle_id)
+    if bundle is None or bundle.user_id != user_id:
+        return None
+    return bundle
 
 
 # -------------------------
 # Bundle 엔드포인트들
 # -------------------------
 
+# 읽기 전용 목록 조회용: ORM 객체(identity map 등록, 속성 계측) 없이 컬럼만 Row 로 읽음
+# - Row 는 속성 접근이 되므로 BundleOut(from_attributes) 이 그대로 검증
+# - 번들 컬럼 이름 = ORM 속성 이름이라 테이블 컬럼을 그대로 사용
+BUNDLE_COLUMNS = tuple(Bundle.__table__.columns)
+
 
-@router.get("/", response_model=List[BundleOut])
-def list_bundles(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@router.get("/", response_model=BundlePage)
+async def list_bundles(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
-    현재 로그인한 유저의 번들 목록 조회.
-    프론트: GET /bundles/ (쿼리 파라미터 없음)
+    현재 로그인한 유저의 번들 목록 조회 (최신순, keyset 페이지네이션).
+    프론트: GET /bundles/?limit=&cursor=  → { items, next_cursor }
+    - 다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨서 요청
     """
     logger.info("[list_bundles] current_user.id=%s", current_user.id)
 
+    stmt = select(*BUNDLE_COLUMNS).where(
+        Bundle.user_id == current_user.id,
+        Bundle.is_archived == False,  # noqa: E712
+    )
+    if cursor:
+        stmt = stmt.where(
+            tuple_(Bundle.created_at, Bundle.id) < decode_cursor(cursor)
+        )
+
     try:
-        bundles = (
-            db.query(Bundle)
-            .filter(
-                Bundle.user_id == current_user.id,
-                Bundle.is_archived == False,  # noqa: E712
-            )
-            .order_by(Bundle.created_at.desc())
-            .all()
+        # limit + 1 개를 읽어서 다음 페이지가 있는지 판단
+        result = await db.execute(
+            stmt.order_by(Bundle.created_at.desc(), Bundle.id.desc()).limit(limit + 1)
         )
-        return bundles
+        bundles = result.all()
     except Exception as e:
         logger.exception("[list_bundles] unexpected error: %r", e)
         raise HTTPException(status_code=500, detail="Failed to load bundles")
 
+    next_cursor = None
+    if len(bundles) > limit:
+        bundles = bundles[:limit]
+        next_cursor = encode_cursor(bundles[-1].created_at, bundles[-1].id)
+
+    return BundlePage(items=bundles, next_cursor=next_cursor)
+
+
+@router.get("/tree", response_model=List[BundleTreeOut])
+async def list_bundle_tree(
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    현재 유저의 번들 전체를 트리 순서로 조회 (재귀 CTE 쿼리 1번, 페이지네이션 없음).
+    - 루트부터 깊이 우선: 부모 바로 뒤에 자식들, 형제끼리는 최신순 (목록 API 와 같은 정렬)
+    - 보관된 번들과 그 하위 번들은 빠짐
+    """
+    logger.info("[list_bundle_tree] current_user.id=%s", current_user.id)
+
+    # 형제 안에서의 순번 (created_at DESC, id DESC) 을 경로 배열로 쌓아서 정렬 키로 사용
+    sibling_rank = (
+        func.row_number()
+        .over(
+            partition_by=Bundle.parent_id,
+            order_by=(Bundle.created_at.desc(), Bundle.id.desc()),
+        )
+    )
+    tree = (
+        select(
+            Bundle.id,
+            literal(0).label("depth"),
+            array([sibling_rank]).label("path"),
+        )
+        .where(
+            Bundle.user_id == current_user.id,
+            Bundle.parent_id.is_(None),
+            Bundle.is_archived == False,  # noqa: E712
+        )
+        .cte("bundle_tree", recursive=True)
+    )
+    child = aliased(Bundle)
+    child_rank = (
+        func.row_number()
+        .over(
+            partition_by=child.parent_id,
+            order_by=(child.created_at.desc(), child.id.desc()),
+        )
+    )
+    tree = tree.union_all(
+        select(
+            child.id,
+            tree.c.depth + 1,
+            func.array_append(tree.c.path, child_rank),
+        )
+        .join(tree, child.parent_id == tree.c.id)
+        .where(
+            child.user_id == current_user.id,
+            child.is_archived == False,  # noqa: E712
+        )
+    )
+
+    try:
+        result = await db.execute(
+            select(*BUNDLE_COLUMNS, tree.c.depth)
+            .join(tree, Bundle.id == tree.c.id)
+            .order_by(tree.c.path)
+        )
+        rows = result.all()
+    except Exception as e:
+        logger.exception("[list_bundle_tree] unexpected error: %r", e)
+        raise HTTPException(status_code=500, detail="Failed to load bundles")
+
+    return rows
+
 
 @router.post("/", response_model=BundleOut)
-def create_bundle(
+async def create_bundle(
     payload: BundleCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     요청 바디의 user_id는 무시하고,
     항상 현재 로그인한 유저(current_user.id)를 번들의 owner로 사용.
     """
-    bundle = Bundle(
-        user_id=current_user.id,
-        parent_id=payload.parent_id,
-        name=payload.name,
-        description=payload.description,
-        color=payload.color,
-        icon=payload.icon,
-    )
-    db.add(bundle)
-    db.commit()
-    db.refresh(bundle)
+    # INSERT ... RETURNING 으로 server default(created_at 등)까지 한 번에 받음 (refresh 불필요)
+    bundle = await db.scalar(
+        insert(Bundle)
+        .values(
+            user_id=current_user.id,
+            parent_id=payload.parent_id,
+            name=payload.name,
+            description=payload.description,
+            color=payload.color,
+            icon=payload.icon,
+        )
+        .returning(Bundle)
+    )
+    await db.commit()
     return bundle
 
 
 @router.patch("/{bundle_id}", response_model=BundleOut)
-def update_bundle(
+async def update_bundle(
     bundle_id: UUID,
     payload: BundleUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     번들 수정 (이름/설명/색상/아이콘/아카이브 등)
     프론트: PATCH /bundles/{bundle_id}
     """
-    bundle = (
-        db.query(Bundle)
-        .filter(
-            Bundle.id == bundle_id,
-            Bundle.user_id == current_user.id,
+    # None 이 아닌 필드만 SET (SELECT 후 속성 변경 대신 UPDATE ... RETURNING 한 번)
+    values = payload.model_dump(exclude_none=True)
+    owned = (Bundle.id == bundle_id, Bundle.user_id == current_user.id)
+
+    if values:
+        result = await db.execute(
+            update(Bundle).where(*owned).values(**values).returning(Bundle)
         )
-        .first()
-    )
+        bundle = result.scalar_one_or_none()
+        if bundle:
+            await db.commit()
+    else:
+        bundle = await db.scalar(select(Bundle).where(*owned))
+
     if not bundle:
         raise HTTPException(status_code=404, detail="Bundle not found")
 
-    updated = False
-
-    if payload.name is not None:
-        bundle.name = payload.name
-        updated = True
-    if payload.description is not None:
-        bundle.description = payload.description
-        updated = True
-    if payload.color is not None:
-        bundle.color = payload.color
-        updated = True
-    if payload.icon is not None:
-        bundle.icon = payload.icon
-        updated = True
-    if payload.is_archived is not None:
-        bundle.is_archived = payload.is_archived
-        updated = True
-
-    if payload.parent_id is not None:
-        bundle.parent_id = payload.parent_id
-        updated = True
-
-    if updated:
-        db.add(bundle)
-        db.commit()
-        db.refresh(bundle)
-
     return bundle
 
 
-@router.delete("/{bundle_id}")
-def delete_bundle(
+@router.delete("/{bundle_id}", status_code=204)
+async def delete_bundle(
     bundle_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     번들 삭제 (하위 번들 + 그 안의 메모까지 모두 삭제)
-    프론트: DELETE /bundles/{bundle_id}
+    프론트: DELETE /bundles/{bundle_id}  → 204 No Content
     """
-    # 1) 우선 내가 소유한 번들인지 확인
-    root_bundle = (
-        db.query(Bundle)
-        .filter(
-            Bundle.id == bundle_id,
-            Bundle.user_id == current_user.id,
-        )
-        .first()
+    # 나 + 모든 하위 번들 (재귀 CTE, DB 안에서 한 번에 수집)
+    # - UNION(중복 제거) 이라 parent_id 가 꼬여서 순환이 생겨도 끝남
+    # - 소유 여부는 user_id 조건 + RETURNING 결과로 확인
+    subtree = (
+        select(Bundle.id)
+        .where(Bundle.id == bundle_id, Bundle.user_id == current_user.id)
+        .cte("bundle_subtree", recursive=True)
+    )
+    child = aliased(Bundle)
+    subtree = subtree.union(
+        select(child.id)
+        .join(subtree, child.parent_id == subtree.c.id)
+        .where(child.user_id == current_user.id)
     )
-    if not root_bundle:
-        raise HTTPException(status_code=404, detail="Bundle not found")
-
-    # 2) 나 + 모든 하위 번들의 id 수집 (DFS)
-    ids_to_delete: list[UUID] = []
-    stack: list[UUID] = [root_bundle.id]
-
-    while stack:
-        cur = stack.pop()
-        if cur in ids_to_delete:
-            continue
-        ids_to_delete.append(cur)
 
-        children = (
-            db.query(Bundle)
-            .filter(
+    try:
+        # 번들 삭제 한 번으로 끝냄 (DELETE ... WHERE id IN (WITH RECURSIVE ...) RETURNING id)
+        #    memory_items.bundle_id 가 ON DELETE CASCADE 라서 메모는 DB 가 같이 삭제
+        result = await db.execute(
+            delete(Bundle)
+            .where(
                 Bundle.user_id == current_user.id,
-                Bundle.parent_id == cur,
+                Bundle.id.in_(select(subtree.c.id)),
             )
-            .all()
+            .returning(Bundle.id)
+            .execution_options(synchronize_session=False)
         )
-        for child in children:
-            stack.append(child.id)
+        deleted_ids = result.scalars().all()
+        if not deleted_ids:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Bundle not found")
 
-    try:
-        if ids_to_delete:
-            # 3) 해당 번들들에 속한 메모 먼저 삭제
-            db.query(MemoryItem).filter(
-                MemoryItem.user_id == current_user.id,
-                MemoryItem.bundle_id.in_(ids_to_delete),
-            ).delete(synchronize_session=False)
-
-            # 4) 번들들 삭제
-            db.query(Bundle).filter(
-                Bundle.user_id == current_user.id,
-                Bundle.id.in_(ids_to_delete),
-            ).delete(synchronize_session=False)
-
-        db.commit()
+        await db.commit()
 
+        # 하위 번들의 메모까지 CASCADE 로 지워짐
+        await forget_memory_context(current_user.id)
         logger.info(
-            "[delete_bundle] user_id=%s deleted_bundle_ids=%s",
+            "[delete_bundle] user_id=%s bundle_id=%s deleted_count=%d",
             current_user.id,
-            [str(bid) for bid in ids_to_delete],
+            bundle_id,
+            len(deleted_ids),
         )
 
-        return {
-          "ok": True,
-          "deleted_bundle_ids": [str(bid) for bid in ids_to_delete],
-        }
+        return Response(status_code=204)
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.exception("[delete_bundle] failed: %r", e)
         raise HTTPException(status_code=500, detail="Failed to delete bundle")
 
@@ -426,145 +1173,129 @@ def delete_bundle(
 # -------------------------
 
 
-@router.post("/auto-group/preview", response_model=AutoGroupPreviewResponse)
-async def preview_auto_group_bundles(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    # 프론트에서 보내는 헤더 (개인 키 or 평가용 비밀번호)
-    x_openai_api_key: Optional[str] = Header(None, alias="X-OpenAI-Api-Key"),
-    x_shared_api_password: Optional[str] = Header(
-        None, alias="X-Shared-Api-Password"
-    ),
-):
+async def _preview_auto_group_groups(
+    bundles: List[Row],
+    names: List[str],
+    cache_key: str,
+    x_openai_api_key: Optional[str],
+    x_shared_api_password: Optional[str],
+) -> dict:
     """
-    번들 자동 정리 미리보기.
-
-    - 현재 유저의 번들을 전부 가져온 다음
-    - 헤더 / 환경변수에서 OpenAI 클라이언트를 만든 뒤
-    - LLM에게 "어떤 상위 번들로 묶을지"를 물어본다.
-    - 실패하거나 클라이언트가 없으면 500 내지 않고 groups 빈 배열 리턴.
+    로컬 그룹핑 → 남은 번들만 LLM 에 물어봐서 합친 결과 ({groups: [...]}, 이름 기준).
+    - 남은 번들이 2개 미만이면 LLM 호출 없이 끝
+    - 남은 번들이 많으면 AUTO_GROUP_SHARD_SIZE 개씩 나눠서 동시에 호출
+    - LLM 을 못 쓰거나 실패하면 로컬 그룹(+ 성공한 shard)만 반환 (이 경우는 캐시하지 않음)
     """
-    bundles = (
-        db.query(Bundle)
-        .filter(
-            Bundle.user_id == current_user.id,
-            Bundle.is_archived == False,  # noqa: E712
-        )
-        .order_by(Bundle.created_at.asc())
-        .all()
-    )
-
-    # 번들이 너무 적으면 그냥 리턴
-    if len(bundles) < 2:
-        return AutoGroupPreviewResponse(groups=[])
+    groups, leftover = local_auto_group(names)
+    obj = {"groups": groups}
+    if len(leftover) < 2:
+        await cache_set(cache_key, orjson.dumps(obj).decode(), AUTO_GROUP_CACHE_TTL_SECONDS)
+        return obj
 
     # OpenAI 클라이언트 생성 (개인 키 / 평가용 비밀번호 + 서버 키)
     client = build_openai_client(x_openai_api_key, x_shared_api_password)
     if client is None:
         logger.warning(
             "[auto_group_preview] no OpenAI client "
-            "(user_key=%s, shared_pwd=%s) → return empty groups",
+            "(user_key=%s, shared_pwd=%s) → local groups only",
             bool(x_openai_api_key),
             bool(x_shared_api_password),
         )
-        return AutoGroupPreviewResponse(groups=[])
+        return obj
+
+    # 남은 번들이 많으면 AUTO_GROUP_SHARD_SIZE 개씩 나눠 동시에 호출
+    # - 요청마다 system prefix 는 같음 (프롬프트 캐시 공유), 실패한 shard 만 빠짐
+    # - 같은 이름 번들은 같은 shard 로 (이름 기준 응답이라 나뉘면 안 됨)
+    leftover_names = set(leftover)
+    shard_by_name = {
+        name: i // AUTO_GROUP_SHARD_SIZE for i, name in enumerate(leftover)
+    }
+    shards: List[List[Row]] = [[] for _ in range(len(leftover) // AUTO_GROUP_SHARD_SIZE + 1)]
+    for b in bundles:
+        if b.name in shard_by_name:
+            shards[shard_by_name[b.name]].append(b)
+    results = await asyncio.gather(
+        *(_request_auto_group_shard(client, shard) for shard in shards if shard)
+    )
 
-    # LLM에 넘길 번들 리스트 (이름 기준으로 묶게 시킴)
-    items = [{"id": str(b.id), "name": b.name} for b in bundles]
-    items_json = json.dumps(items, ensure_ascii=False)
-
-    system_msg = (
-        "당신은 사용자의 '번들(폴더)' 이름을 보고, 의미적으로 비슷한 번들을 "
-        "상위 카테고리로 묶어 주는 도우미입니다. "
-        "반드시 JSON 객체 하나만 출력하고, 설명 문장은 쓰지 마세요."
-    )
-
-    prompt = f"""
-다음은 사용자가 만든 '번들(폴더)' 목록이야.
-비슷한 것끼리 상위 카테고리를 만들어서 묶어줘.
-
-규칙:
-- 각 그룹은 다음 필드를 가진다.
-  - parent_name: 새로 만들 상위 번들 이름 (한국어 4~12자 정도의 명사구)
-  - children: 이 그룹에 넣을 기존 번들의 '이름' 문자열 리스트
-- parent_name 에는 "사용자:", "LLM:" 과 같은 말하는 사람 접두어나
-  이모지, 불필요한 기호를 넣지 마.
-- 콜론(:) 으로 끝나지 않게 해.
-- 애매하면 그룹을 만들지 말고, 소수의 그룹만 만들어.
-
-반환 형식은 반드시 아래 JSON 예시와 같은 형태로, JSON 객체 한 개만 출력해.
-
-{{
-  "groups": [
-    {{
-      "parent_name": "국가",
-      "children": ["일본", "중국", "한국"]
-    }},
-    {{
-      "parent_name": "음식",
-      "children": ["한국 음식", "일본 음식"]
-    }}
-  ]
-}}
-
-설명 문장은 절대 쓰지 말고, 위 형식의 JSON 객체 하나만 출력해.
-
-번들 목록:
-{items_json}
-"""
+    # 이미 로컬에서 묶인 번들이 LLM 그룹에 또 들어가지 않도록 남은 이름만 남기고,
+    # shard 끼리 같은 parent_name 을 만들었으면 한 그룹으로 합침
+    llm_groups: Dict[str, List[str]] = {}
+    for shard_groups in results:
+        for g in shard_groups or []:
+            children = [c for c in g.get("children", []) if c in leftover_names]
+            llm_groups.setdefault(g.get("parent_name", ""), []).extend(children)
+    groups.extend(
+        {"parent_name": parent_name, "children": children}
+        for parent_name, children in llm_groups.items()
+    )
+
+    if any(r is None for r in results):
+        # 일부 shard 실패 → 이번 응답에만 쓰고 캐시하지 않음
+        return obj
+    await cache_set(cache_key, orjson.dumps(obj).decode(), AUTO_GROUP_CACHE_TTL_SECONDS)
+    return obj
 
+
+async def _request_auto_group_shard(
+    client: AsyncOpenAI,
+    bundles: List[Row],
+) -> Optional[List[dict]]:
+    """번들 일부에 대한 자동 정리 LLM 호출 → LLM groups (이름 기준). 실패/거부 시 None."""
     try:
-        resp = client.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": system_msg},
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=512,
-            temperature=0.2,
-        )
-        raw = (resp.choices[0].message.content or "").strip()
-        logger.info("[auto_group_preview] raw LLM response: %s", raw)
-        obj = json.loads(raw)
+        resp = await client.chat.completions.create(**auto_group_request_body(bundles))
+        message = resp.choices[0].message
+        if getattr(message, "refusal", None):
+            logger.warning("[auto_group_preview] LLM refused: %s", message.refusal)
+            return None
+        raw = (message.content or "").strip()
+        logger.debug("[auto_group_preview] raw LLM response: %s", raw)
+        # response_format(json_schema, strict) 라서 형식은 서버에서 보장됨
+        # (max_tokens 에 걸려 잘린 경우만 파싱 실패 가능)
+        return orjson.loads(raw).get("groups", [])
     except Exception as e:
+        # LLM 에러나 JSON 파싱 실패해도 500 안 내고 이 shard 만 빠짐
         logger.exception("[auto_group_preview] LLM call or JSON parse failed: %r", e)
-        # LLM 에러나 JSON 파싱 실패해도 500 안 내고 빈 결과
-        return AutoGroupPreviewResponse(groups=[])
+        return None
 
-    # 번들 "이름" → id 리스트 매핑 (같은 이름 여러 개 대비)
-    name_to_ids: Dict[str, List[str]] = {}
-    for b in bundles:
-        name_to_ids.setdefault(b.name, []).append(str(b.id))
 
-    groups: List[AutoGroupCandidate] = []
-    try:
-        for g in obj.get("groups", []):
-            parent_name = str(g.get("parent_name", "")).strip()
-            if not parent_name:
-                continue
+@router.post("/auto-group/preview", response_model=AutoGroupPreviewResponse)
+async def preview_auto_group_bundles(
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    # 프론트에서 보내는 헤더 (개인 키 or 평가용 비밀번호)
+    x_openai_api_key: Optional[str] = Header(None, alias="X-OpenAI-Api-Key"),
+    x_shared_api_password: Optional[str] = Header(
+        None, alias="X-Shared-Api-Password"
+    ),
+):
+    """
+    번들 자동 정리 미리보기.
 
-            children_names = g.get("children", [])
-            if not isinstance(children_names, list):
-                continue
+    - 현재 유저의 번들을 전부 가져온 다음
+    - 공통 단어로 확실히 묶이는 것은 로컬에서 바로 묶고 (local_auto_group)
+    - 남은 번들만 LLM에게 "어떤 상위 번들로 묶을지"를 물어본다.
+    - 같은 번들 이름 목록이면 캐시된 결과를 그대로 사용.
+    - LLM 이 실패하거나 클라이언트가 없으면 500 내지 않고 로컬 그룹만 리턴.
+    """
+    bundles = await load_auto_group_bundles(db, current_user.id)
 
-            child_bundle_ids: List[str] = []
-            for cname in children_names:
-                cname_str = str(cname).strip()
-                if not cname_str:
-                    continue
-                # 같은 이름 번들이 여러 개 있을 수도 있으니 전부 추가
-                child_bundle_ids.extend(name_to_ids.get(cname_str, []))
+    # 번들이 너무 적으면 그냥 리턴
+    if len(bundles) < 2:
+        return AutoGroupPreviewResponse(groups=[])
 
-            # 실제로 매핑된 번들이 있어야 유효 그룹
-            if not child_bundle_ids:
-                continue
+    names = list(dict.fromkeys(b.name for b in bundles))
+    cache_key = _auto_group_cache_key(names)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        obj = orjson.loads(cached)
+    else:
+        obj = await _preview_auto_group_groups(
+            bundles, names, cache_key, x_openai_api_key, x_shared_api_password
+        )
 
-            groups.append(
-                AutoGroupCandidate(
-                    parent_name=parent_name,
-                    child_bundle_ids=child_bundle_ids,
-                )
-            )
+    try:
+        groups = build_auto_group_candidates(obj, bundles)
     except Exception as e:
         logger.exception("[auto_group_preview] build groups failed: %r", e)
         return AutoGroupPreviewResponse(groups=[])
@@ -578,11 +1309,110 @@ async def preview_auto_group_bundles(
     return AutoGroupPreviewResponse(groups=groups)
 
 
+@router.post(
+    "/auto-group/schedule",
+    response_model=AutoGroupJobOut,
+    status_code=202,
+)
+async def schedule_auto_group_bundles(
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    x_openai_api_key: Optional[str] = Header(None, alias="X-OpenAI-Api-Key"),
+    x_shared_api_password: Optional[str] = Header(
+        None, alias="X-Shared-Api-Password"
+    ),
+):
+    """
+    번들 자동 정리를 OpenAI Batch API 로 예약 (미리보기와 같은 요청, 최대 24시간 뒤 결과).
+    - 응답의 job_id 로 GET /bundles/auto-group/result/{job_id} 조회
+    - 결과는 미리보기와 같은 groups 형식이라 그대로 /auto-group/apply 에 넘기면 됨
+    """
+    bundles = await load_auto_group_bundles(db, current_user.id)
+
+    job_id = uuid4()
+    batch_id: Optional[str] = None
+    if len(bundles) < 2:
+        # 묶을 게 없으면 배치 없이 바로 완료
+        status = "completed"
+        groups: Optional[List[dict]] = []
+    else:
+        client = build_openai_client(x_openai_api_key, x_shared_api_password)
+        if client is None:
+            raise HTTPException(status_code=400, detail="OpenAI key required")
+        try:
+            batch_id = await submit_chat_batch(
+                client,
+                [(str(job_id), auto_group_request_body(bundles))],
+                metadata={"kind": "auto_group", "user_id": str(current_user.id)},
+            )
+        except Exception as e:
+            logger.warning("[auto_group_schedule] batch submit failed: %r", e)
+            raise HTTPException(status_code=502, detail="Failed to submit batch")
+        status = "validating"
+        groups = None
+
+    job = await db.scalar(
+        insert(AutoGroupJob)
+        .values(
+            id=job_id,
+            user_id=current_user.id,
+            batch_id=batch_id,
+            status=status,
+            groups=groups,
+        )
+        .returning(AutoGroupJob)
+    )
+    await db.commit()
+
+    if batch_id is not None:
+        background_tasks.add_task(poll_auto_group_job, job_id, current_user.id, client)
+
+    logger.info(
+        "[auto_group_schedule] user_id=%s job_id=%s batch_id=%s bundle_count=%d",
+        current_user.id,
+        job_id,
+        batch_id,
+        len(bundles),
+    )
+    return AutoGroupJobOut(job_id=job.id, status=job.status, groups=job.groups)
+
+
+@router.get("/auto-group/result/{job_id}", response_model=AutoGroupJobOut)
+async def get_auto_group_result(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    x_openai_api_key: Optional[str] = Header(None, alias="X-OpenAI-Api-Key"),
+    x_shared_api_password: Optional[str] = Header(
+        None, alias="X-Shared-Api-Password"
+    ),
+):
+    """
+    예약한 자동 정리 결과 조회.
+    - 아직 안 끝났고 키 헤더가 있으면 배치 상태를 바로 확인해서 반영
+      (배치는 제출할 때 쓴 키의 계정에 있으므로 같은 키가 필요)
+    """
+    job = await db.get(AutoGroupJob, job_id)
+    if job is None or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Auto-group job not found")
+
+    finished = job.status == "completed" or job.status in BATCH_FAILED_STATUSES
+    client = build_openai_client(x_openai_api_key, x_shared_api_password)
+    if not finished and client is not None:
+        try:
+            job = await sync_auto_group_job(job_id, current_user.id, client) or job
+        except Exception as e:
+            logger.warning("[auto_group_result] sync failed (job_id=%s): %r", job_id, e)
+
+    return AutoGroupJobOut(job_id=job.id, status=job.status, groups=job.groups)
+
+
 @router.post("/auto-group/apply", response_model=List[BundleOut])
-def apply_auto_group(
+async def apply_auto_group(
     payload: AutoGroupApplyRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     미리보기에서 확정된 그룹 정보를 받아:
@@ -590,115 +1420,112 @@ def apply_auto_group(
     2) child_bundle_ids 에 해당하는 기존 번들의 parent_id 를 새 번들로 설정한다.
     """
     logger.info(
-        "[apply_auto_group] user_id=%s groups=%s",
+        "[apply_auto_group] user_id=%s group_count=%d",
         current_user.id,
-        payload.groups,
+        len(payload.groups),
+    )
+
+    # 유저의 번들을 한 번만 읽어서 child 확인 / 같은 이름 parent 찾기 / 빈 요청 응답에 공용
+    result = await db.execute(
+        select(Bundle)
+        .where(
+            Bundle.user_id == current_user.id,
+            Bundle.is_archived == False,  # noqa: E712
+        )
+        .order_by(Bundle.created_at.desc())
     )
+    all_bundles = result.scalars().all()
 
     if not payload.groups:
         # 정리할 게 없으면 그냥 현재 번들 목록 반환
-        bundles = (
-            db.query(Bundle)
-            .filter(
-                Bundle.user_id == current_user.id,
-                Bundle.is_archived == False,  # noqa: E712
-            )
-            .order_by(Bundle.created_at.desc())
-            .all()
-        )
-        return bundles
+        return all_bundles
 
     try:
-        # child id 들 → 실제 번들 객체 캐시
-        bundle_map: dict[UUID, Bundle] = {}
-
-        all_child_ids: List[UUID] = []
+        bundle_map: dict[UUID, Bundle] = {b.id: b for b in all_bundles}
+        top_level_by_name: dict[str, Bundle] = {}
+        for b in reversed(all_bundles):
+            # 같은 이름이 여러 개면 가장 오래된 것 (기존 .limit(1) 과 비슷하게)
+            if b.parent_id is None:
+                top_level_by_name.setdefault(b.name, b)
+
+        # 1) 그룹별 parent 번들 결정 (같은 이름의 최상위 번들이 있으면 재사용)
+        parent_by_name: dict[str, Optional[Bundle]] = {}
         for g in payload.groups:
-            for cid in g.child_bundle_ids:
-                try:
-                    all_child_ids.append(UUID(cid))
-                except Exception:
-                    logger.warning("[apply_auto_group] invalid UUID: %s", cid)
-
-        if all_child_ids:
-            existing_children = (
-                db.query(Bundle)
-                .filter(
-                    Bundle.user_id == current_user.id,
-                    Bundle.id.in_(all_child_ids),
-                )
-                .all()
+            parent_name = g.parent_name.strip()
+            if parent_name:
+                parent_by_name[parent_name] = top_level_by_name.get(parent_name)
+
+        # 2) 없는 parent 들은 INSERT ... RETURNING 한 번으로 같이 생성
+        new_names = [name for name, b in parent_by_name.items() if b is None]
+        new_parents: List[Bundle] = []
+        if new_names:
+            result = await db.scalars(
+                insert(Bundle).returning(Bundle),
+                [
+                    {
+                        "user_id": current_user.id,
+                        "parent_id": None,
+                        "name": name,
+                        "description": "자동 정리로 생성된 상위 번들",
+                        "color": "#4F46E5",
+                        "icon": "�",
+                    }
+                    for name in new_names
+                ],
             )
-            for b in existing_children:
-                bundle_map[b.id] = b
-
-        # 그룹별로 새 parent 번들 만들고, child.parent_id 업데이트
+            new_parents = result.all()
+            for b in new_parents:
+                parent_by_name[b.name] = b
+
+        # 3) child.parent_id 변경은 PK 기준 bulk UPDATE (executemany 한 번)
+        # - updated_at 은 onupdate 대신 직접 넣어서, 응답용 메모리 객체와 DB 값을 맞춤
+        now = datetime.now(timezone.utc)
+        child_updates: List[dict] = []
         for g in payload.groups:
-            parent_name = g.parent_name.strip()
-            if not parent_name:
+            parent_bundle = parent_by_name.get(g.parent_name.strip())
+            if parent_bundle is None:
                 continue
 
-            # 이미 같은 이름의 상위 번들이 있는지 확인 (선택 사항)
-            existing_parent = (
-                db.query(Bundle)
-                .filter(
-                    Bundle.user_id == current_user.id,
-                    Bundle.parent_id.is_(None),
-                    Bundle.name == parent_name,
-                )
-                .first()
-            )
-
-            if existing_parent:
-                parent_bundle = existing_parent
-            else:
-                parent_bundle = Bundle(
-                    user_id=current_user.id,
-                    parent_id=None,
-                    name=parent_name,
-                    description="자동 정리로 생성된 상위 번들",
-                    color="#4F46E5",
-                    icon="�",
-                )
-                db.add(parent_bundle)
-                db.flush()  # id 확보용
-
-            for cid_str in g.child_bundle_ids:
-                try:
-                    cid = UUID(cid_str)
-                except Exception:
-                    logger.warning(
-                        "[apply_auto_group] skip invalid child id=%s", cid_str
-                    )
-                    continue
-
-                child = bundle_map.get(cid)
-                if not child:
+            for cid in g.child_bundle_ids:
+                if cid not in bundle_map:
                     logger.warning(
                         "[apply_auto_group] child bundle not found: %s", cid
                     )
                     continue
+                if cid == parent_bundle.id:
+                    # 자기 자신을 부모로 만들지 않음
+                    continue
 
-                child.parent_id = parent_bundle.id
-                db.add(child)
-
-        db.commit()
+                child_updates.append(
+                    {"id": cid, "parent_id": parent_bundle.id, "updated_at": now}
+                )
 
-        # 최종 번들 목록 반환
-        bundles = (
-            db.query(Bundle)
-            .filter(
-                Bundle.user_id == current_user.id,
-                Bundle.is_archived == False,  # noqa: E712
+        if child_updates:
+            await db.execute(
+                update(Bundle).where(Bundle.user_id == current_user.id),
+                child_updates,
+                execution_options={"synchronize_session": None},
             )
-            .order_by(Bundle.created_at.desc())
-            .all()
+
+        await db.commit()
+
+        # 최종 번들 목록은 다시 SELECT 하지 않고 메모리에서 만듦
+        # - bulk UPDATE 는 세션 객체를 안 바꾸므로 바뀐 값만 committed 상태로 반영
+        #   (expire_on_commit=False 라 나머지 속성은 그대로 유효)
+        for row in child_updates:
+            child = bundle_map[row["id"]]
+            set_committed_value(child, "parent_id", row["parent_id"])
+            set_committed_value(child, "updated_at", row["updated_at"])
+
+        return sorted(
+            [*all_bundles, *new_parents],
+            key=lambda b: b.created_at,
+            reverse=True,
         )
-        return bundles
 
     except Exception as e:
         logger.exception("[apply_auto_group] unexpected error: %r", e)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to apply auto grouping")
 
 # -------------------------
@@ -706,14 +1533,17 @@ def apply_auto_group(
 # -------------------------
 
 
-@router.get("/{bundle_id}/memories", response_model=List[MemoryItemOut])
-def list_memories_for_bundle(
+@router.get("/{bundle_id}/memories", response_model=MemoryItemPage)
+async def list_memories_for_bundle(
     bundle_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
-    특정 번들의 메모 목록 조회 (현재 유저 소유 번들만)
+    특정 번들의 메모 목록 조회 (현재 유저 소유 번들만, 최신순 keyset 페이지네이션)
+    - 응답: { items, next_cursor }
     """
     logger.info(
         "[list_memories_for_bundle] user_id=%s bundle_id=%s",
@@ -721,195 +1551,394 @@ def list_memories_for_bundle(
         bundle_id,
     )
 
-    # 번들이 내 것인지 확인
-    bundle = (
-        db.query(Bundle)
-        .filter(
+    # 번들 소유 여부를 JOIN 으로 같이 확인 (쿼리 1번)
+    stmt = (
+        select(MemoryItem)
+        .join(Bundle, Bundle.id == MemoryItem.bundle_id)
+        .where(
             Bundle.id == bundle_id,
             Bundle.user_id == current_user.id,
+            MemoryItem.user_id == current_user.id,
         )
-        .first()
     )
-    if not bundle:
-        raise HTTPException(status_code=404, detail="Bundle not found")
-
-    memories = (
-        db.query(MemoryItem)
-        .filter(
-            MemoryItem.bundle_id == bundle_id,
-            MemoryItem.user_id == current_user.id,
+    if cursor:
+        stmt = stmt.where(
+            tuple_(MemoryItem.created_at, MemoryItem.id) < decode_cursor(cursor)
         )
-        .order_by(MemoryItem.created_at.desc())
-        .all()
+
+    result = await db.execute(
+        stmt.order_by(MemoryItem.created_at.desc(), MemoryItem.id.desc())
+        .limit(limit + 1)
     )
+    memories = result.scalars().all()
 
-    return [memory_to_out(m) for m in memories]
+    if not memories:
+        # 결과가 비었을 때만 "빈 번들"인지 "없는 번들"인지 구분
+        if await get_owned_bundle(db, current_user.id, bundle_id) is None:
+            raise HTTPException(status_code=404, detail="Bundle not found")
+
+    next_cursor = None
+    if len(memories) > limit:
+        memories = memories[:limit]
+        next_cursor = encode_cursor(memories[-1].created_at, memories[-1].id)
+
+    return MemoryItemPage(
+        items=memories,
+        next_cursor=next_cursor,
+    )
 
 
 @router.post("/{bundle_id}/memories", response_model=MemoryItemOut)
-def create_memory_for_bundle(
+async def create_memory_for_bundle(
     bundle_id: UUID,
     payload: MemoryFromBlockCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
     x_openai_key: Optional[str] = Header(None),
     x_shared_api_password: Optional[str] = Header(None),
 ):
     """
     번들에 메모 저장 (+ 요약 자동 생성).
     프론트: POST /bundles/{bundle_id}/memories
+
+    요약은 응답 후 백그라운드에서 채워지므로 응답의 summary 는 None 일 수 있음.
+    - 이때는 202 + summary_status='pending' 으로 응답하고,
+      프론트는 GET /bundles/{bundle_id}/memories/{memory_id} 로 done/failed 를 확인
     """
 
     logger.info(
-        "[create_memory_for_bundle] bundle_id=%s user_id=%s title=%s",
+        "[create_memory_for_bundle] bundle_id=%s user_id=%s title_len=%d text_len=%d",
         bundle_id,
         current_user.id,
-        payload.title,
+        len(payload.title or ""),
+        len(payload.original_text),
     )
 
-    # 1) 번들 존재 + 소유자 확인
-    bundle = (
-        db.query(Bundle)
-        .filter(
-            Bundle.id == bundle_id,
-            Bundle.user_id == current_user.id,
+    # 1) OpenAI 클라이언트 생성 (요약은 저장 후 백그라운드에서)
+    client = build_openai_client(x_openai_key, x_shared_api_password)
+
+    # 1-1) 제목 정리: 너무 길거나 비어 있으면 자동 생성
+    #      프론트에서 대화 전체를 title로 보내더라도 무시하고 새로 만듦
+    # 1-2) 캐시/짧은 메모로 바로 정해지는 요약은 저장할 때 같이 넣음
+    #  → 둘 다 DB 세션을 안 쓰는 독립 I/O(LLM, Redis)라서 동시에 실행
+    raw_title = (payload.title or "").strip() if hasattr(payload, "title") else ""
+    needs_title = not raw_title or len(raw_title) > 40
+
+    async def resolve_title() -> str:
+        if needs_title:
+            return await generate_memory_title(payload.original_text, client)
+        return raw_title
+
+    async def resolve_summary() -> Optional[str]:
+        if client is None:
+            return None
+        return await lookup_summary_without_llm(payload.original_text)
+
+    title_for_memory, summary_now = await asyncio.gather(
+        resolve_title(), resolve_summary()
+    )
+    if summary_now is not None:
+        summary_status = "done"
+    else:
+        summary_status = "pending" if client is not None else None
+
+    # 2) 번들 소유자 확인 + 메모 생성 + 결과 조회를 쿼리 하나로
+    #    INSERT INTO memory_items (...) SELECT ... FROM bundles
+    #    WHERE bundles.id = :bundle_id AND bundles.user_id = :user_id RETURNING *
+    #    → 남의 번들이거나 없는 번들이면 0행 → 404
+    values = {
+        MemoryItem.id: uuid4(),
+        MemoryItem.user_id: current_user.id,
+        MemoryItem.bundle_id: bundle_id,
+        MemoryItem.original_text: payload.original_text,
+        MemoryItem.title: title_for_memory,
+        MemoryItem.summary: summary_now,
+        MemoryItem.summary_status: summary_status,
+        MemoryItem.source_type: payload.source_type,
+        MemoryItem.source_id: payload.source_id,
+        MemoryItem.metadata_json: payload.metadata or {},
+    }
+    stmt = (
+        insert(MemoryItem)
+        .from_select(
+            list(values),
+            select(*[literal(v, col.type) for col, v in values.items()]).where(
+                Bundle.id == bundle_id,
+                Bundle.user_id == current_user.id,
+            ),
         )
-        .first()
+        .returning(MemoryItem)
     )
+    memory = (await db.scalars(stmt)).first()
+    if memory is None:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Bundle not found")
+    await db.commit()
+    await forget_memory_context(current_user.id, new_memory_only=True)
+
+    # 3) LLM 요약은 응답을 보낸 뒤 채움 (LLM 대기 시간을 POST 응답에서 제외)
+    if summary_status == "pending":
+        response.status_code = 202
+        background_tasks.add_task(
+            summarize_and_store,
+            memory.id,
+            current_user.id,
+            payload.original_text,
+            client,
+        )
+
+    return memory
+
+
+
+@router.get("/{bundle_id}/memories/{memory_id}", response_model=MemoryItemOut)
+async def get_memory_for_bundle(
+    bundle_id: UUID,
+    memory_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    메모 하나 조회 (백그라운드 요약 폴링용).
+    - summary_status 가 pending 이 아니게 되면 summary 가 채워진 것 (done) 또는 실패 (failed)
+    """
+    memory = await db.scalar(
+        select(MemoryItem).where(
+            MemoryItem.id == memory_id,
+            MemoryItem.bundle_id == bundle_id,
+            MemoryItem.user_id == current_user.id,
+        )
+    )
+    if memory is None:
+        raise HTTPException(status_code=404, detail="Memory not found")
+    return memory
+
+
+@router.post("/{bundle_id}/memories/bulk", response_model=MemoryBulkCreateOut)
+async def create_memories_bulk_for_bundle(
+    bundle_id: UUID,
+    payload: List[MemoryFromBlockCreate],
+    background_tasks: BackgroundTasks,
+    use_batch: bool = True,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    x_openai_key: Optional[str] = Header(None),
+    x_shared_api_password: Optional[str] = Header(None),
+):
+    """
+    번들에 메모 여러 개를 한 번에 저장.
+    프론트: POST /bundles/{bundle_id}/memories/bulk
+
+    - 요약은 OpenAI Batch API 한 건으로 제출 (summary_status='pending')
+    - 결과는 백그라운드 폴링이 반영하고, 서버 재시작 등으로 폴링이 끊겼으면
+      POST /bundles/summary-batches/{batch_id}/sync 로 반영
+    - ?use_batch=false 면 (최대 24시간 대신) 응답 후 바로 동시에 요약
+    - 제목은 LLM 호출 없이 입력 제목 또는 원문 앞부분으로 정함
+    """
+    if not payload:
+        return MemoryBulkCreateOut(items=[])
+
+    bundle = await get_owned_bundle(db, current_user.id, bundle_id)
     if not bundle:
         raise HTTPException(status_code=404, detail="Bundle not found")
 
-        # 2) OpenAI 클라이언트 생성 후 요약
     client = build_openai_client(x_openai_key, x_shared_api_password)
-    summary_text = summarize_for_memory(payload.original_text, client)
 
-    # 2-1) 제목 정리: 너무 길거나 비어 있으면 자동 생성
-    raw_title = (payload.title or "").strip() if hasattr(payload, "title") else ""
-    if not raw_title or len(raw_title) > 40:
-        # 프론트에서 대화 전체를 title로 보내더라도 무시하고 새로 만듦
-        title_for_memory = generate_memory_title(payload.original_text, client)
-    else:
-        title_for_memory = raw_title
+    rows: List[dict] = []
+    pending: List[dict] = []
+    for item in payload:
+        raw_title = (item.title or "").strip()
+        if not raw_title or len(raw_title) > 40:
+            raw_title = await generate_memory_title(item.original_text, None)
+
+        summary_now = (
+            await lookup_summary_without_llm(item.original_text)
+            if client is not None
+            else None
+        )
+        row = {
+            "id": uuid4(),
+            "user_id": current_user.id,
+            "bundle_id": bundle_id,
+            "original_text": item.original_text,
+            "title": raw_title,
+            "summary": summary_now,
+            "summary_status": "done" if summary_now is not None else None,
+            "summary_batch_id": None,
+            "source_type": item.source_type,
+            "source_id": item.source_id,
+            "metadata_json": item.metadata or {},
+        }
+        rows.append(row)
+        if client is not None and summary_now is None:
+            row["summary_status"] = "pending"
+            pending.append(row)
+
+    # 배치 제출을 먼저 해서 batch_id 를 같이 저장 (INSERT 한 번으로 끝냄)
+    batch_id: Optional[str] = None
+    if use_batch and len(pending) >= SUMMARY_BATCH_MIN_ITEMS:
+        try:
+            batch_id = await submit_chat_batch(
+                client,
+                [
+                    (str(row["id"]), summary_request_body(row["original_text"].strip()))
+                    for row in pending
+                ],
+                metadata={"kind": "memory_summary", "bundle_id": str(bundle_id)},
+            )
+        except Exception as e:
+            logger.warning("[bundles] summary batch submit failed, fallback to per-memory: %r", e)
 
-    # 3) 메모 생성
-    memory = MemoryItem(
-        user_id=current_user.id,
-        bundle_id=bundle_id,
-        original_text=payload.original_text,
-        title=title_for_memory,
-        summary=summary_text,
-        source_type=payload.source_type,
-        source_id=payload.source_id,
-        metadata_json=payload.metadata or {},
-    )
+    if batch_id is not None:
+        for row in pending:
+            row["summary_batch_id"] = batch_id
 
+    memories = (
+        await db.scalars(insert(MemoryItem).returning(MemoryItem), rows)
+    ).all()
+    await db.commit()
+    await forget_memory_context(current_user.id, new_memory_only=True)
+
+    if batch_id is not None:
+        background_tasks.add_task(poll_summary_batch, batch_id, current_user.id, client)
+    elif pending:
+        # 배치 안 씀 / 1건뿐 / 배치 제출 실패 → 응답 후 바로 동시에 요약
+        background_tasks.add_task(
+            summarize_and_store_many,
+            [(row["id"], row["original_text"]) for row in pending],
+            current_user.id,
+            client,
+        )
+
+    return MemoryBulkCreateOut(items=memories, batch_id=batch_id)
+
+
+@router.post("/summary-batches/{batch_id}/sync", response_model=SummaryBatchSyncOut)
+async def sync_summary_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    x_openai_key: Optional[str] = Header(None),
+    x_shared_api_password: Optional[str] = Header(None),
+):
+    """
+    요약 배치 상태를 확인하고, 끝났으면 결과를 메모에 반영.
+    - 배치는 제출할 때 쓴 키의 계정에 있으므로 같은 키 헤더가 필요
+    """
+    owned = (
+        await db.execute(
+            select(MemoryItem.id)
+            .where(
+                MemoryItem.user_id == current_user.id,
+                MemoryItem.summary_batch_id == batch_id,
+            )
+            .limit(1)
+        )
+    ).first()
+    if owned is None:
+        raise HTTPException(status_code=404, detail="Summary batch not found")
 
-    db.add(memory)
-    db.commit()
-    db.refresh(memory)
+    client = build_openai_client(x_openai_key, x_shared_api_password)
+    if client is None:
+        raise HTTPException(status_code=400, detail="OpenAI key required")
 
-    return memory_to_out(memory)
+    try:
+        status, updated = await apply_summary_batch_result(batch_id, current_user.id, client)
+    except Exception as e:
+        logger.warning("[bundles] summary batch sync failed (batch_id=%s): %r", batch_id, e)
+        raise HTTPException(status_code=502, detail="Failed to fetch batch result")
 
+    return SummaryBatchSyncOut(batch_id=batch_id, status=status, updated=updated)
 
 
 @router.patch(
     "/{bundle_id}/memories/{memory_id}",
     response_model=MemoryItemOut,
 )
-def update_memory_for_bundle(
+async def update_memory_for_bundle(
     bundle_id: UUID,
     memory_id: UUID,
     payload: MemoryUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     메모 수정 + 번들 이동 (현재 유저의 메모만)
     """
-    memory = (
-        db.query(MemoryItem)
-        .filter(
-            MemoryItem.id == memory_id,
-            MemoryItem.bundle_id == bundle_id,
-            MemoryItem.user_id == current_user.id,
-        )
-        .first()
+    # None 이 아닌 필드만 SET (API 필드명 metadata → ORM 속성 metadata_json)
+    values = payload.model_dump(exclude_none=True)
+    if "metadata" in values:
+        values["metadata_json"] = values.pop("metadata")
+
+    # 같은 번들로의 "이동"은 변경 없음
+    if values.get("bundle_id") == bundle_id:
+        del values["bundle_id"]
+
+    owned = (
+        MemoryItem.id == memory_id,
+        MemoryItem.bundle_id == bundle_id,
+        MemoryItem.user_id == current_user.id,
     )
-    if not memory:
-        raise HTTPException(status_code=404, detail="Memory not found")
 
-    updated = False
-
-    if payload.title is not None:
-        memory.title = payload.title
-        updated = True
-    if payload.summary is not None:
-        memory.summary = payload.summary
-        updated = True
-    if payload.original_text is not None:
-        memory.original_text = payload.original_text
-        updated = True
-    if payload.metadata is not None:
-        memory.metadata_json = payload.metadata
-        updated = True
-    if payload.is_pinned is not None:
-        memory.is_pinned = payload.is_pinned
-        updated = True
-    if payload.usage_count is not None:
-        memory.usage_count = payload.usage_count
-        updated = True
-
-    # 번들 이동 시에도 대상 번들이 내 것인지 확인
-    if payload.bundle_id is not None and payload.bundle_id != memory.bundle_id:
-        target_bundle = (
-            db.query(Bundle)
-            .filter(
-                Bundle.id == payload.bundle_id,
-                Bundle.user_id == current_user.id,
+    if values:
+        stmt = update(MemoryItem).where(*owned).values(**values)
+        if "bundle_id" in values:
+            # 번들 이동 시 대상 번들이 내 것인지도 같은 UPDATE 안에서 확인 (EXISTS)
+            stmt = stmt.where(
+                exists().where(
+                    Bundle.id == values["bundle_id"],
+                    Bundle.user_id == current_user.id,
+                )
             )
-            .first()
-        )
-        if not target_bundle:
+        result = await db.execute(stmt.returning(MemoryItem))
+        memory = result.scalar_one_or_none()
+        if memory:
+            await db.commit()
+            await forget_memory_context(current_user.id)
+    else:
+        memory = await db.scalar(select(MemoryItem).where(*owned))
+
+    if not memory:
+        # 실패했을 때만 "대상 번들이 없는지" 확인해서 에러 메시지 구분
+        if "bundle_id" in values and await get_owned_bundle(
+            db, current_user.id, values["bundle_id"]
+        ) is None:
             raise HTTPException(
                 status_code=404,
                 detail="Target bundle for move not found",
             )
+        raise HTTPException(status_code=404, detail="Memory not found")
 
-        memory.bundle_id = payload.bundle_id
-        updated = True
-
-    if updated:
-        db.add(memory)
-        db.commit()
-        db.refresh(memory)
-
-    return memory_to_out(memory)
+    return memory
 
 
-@router.delete("/{bundle_id}/memories/{memory_id}")
-def delete_memory_for_bundle(
+@router.delete("/{bundle_id}/memories/{memory_id}", status_code=204)
+async def delete_memory_for_bundle(
     bundle_id: UUID,
     memory_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
-    메모 삭제 (현재 유저의 메모만)
+    메모 삭제 (현재 유저의 메모만) → 204 No Content
     """
-    memory = (
-        db.query(MemoryItem)
-        .filter(
+    # SELECT 없이 DELETE ... RETURNING 한 번으로 존재/소유 확인 + 삭제
+    result = await db.execute(
+        delete(MemoryItem)
+        .where(
             MemoryItem.id == memory_id,
             MemoryItem.bundle_id == bundle_id,
             MemoryItem.user_id == current_user.id,
         )
-        .first()
+        .returning(MemoryItem.id)
     )
-    if not memory:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Memory not found")
 
-    db.delete(memory)
-    db.commit()
+    await db.commit()
+    await forget_memory_context(current_user.id)
 
-    return {"ok": True}
+    return Response(status_code=204)
 
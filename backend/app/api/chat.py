@@ -1,15 +1,31 @@
 # app/api/chat.py
+import asyncio
 import os
+import hashlib
 import json
 import logging
 from typing import List, Literal, Optional, Tuple
 import uuid
 
-from fastapi import APIRouter, Header
+import orjson
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
-from openai import OpenAI, AuthenticationError, APIConnectionError, APIStatusError
-
-from app.core.db import SessionLocal
+from openai import AsyncOpenAI, AuthenticationError, APIConnectionError, APIStatusError
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import AsyncSessionLocal, get_db
+from app.core.cache import cache_get, cache_set
+from app.core.context_cache import (
+    forget_memory_context,
+    load_memory_context,
+    store_memory_context,
+)
+from app.core.http import get_openai_client
+from app.llm import semantic_cache
 from app import models  # MemoryItem, Bundle 등
 
 logger = logging.getLogger("app.chat")
@@ -74,7 +90,7 @@ class ChatResponse(BaseModel):
 def build_openai_client(
     user_api_key: Optional[str],
     shared_api_password: Optional[str],
-) -> Optional[OpenAI]:
+) -> Optional[AsyncOpenAI]:
     """
     우선순위:
     1) user_api_key (개인 키)
@@ -84,7 +100,7 @@ def build_openai_client(
     # 1) 사용자 개인 키
     if user_api_key:
         try:
-            return OpenAI(api_key=user_api_key)
+            return get_openai_client(user_api_key)
         except Exception as e:
             logger.warning("[chat.py] invalid user OpenAI key: %r", e)
 
@@ -97,7 +113,7 @@ def build_openai_client(
     ):
         try:
             logger.info("[chat.py] using SERVER shared OPENAI_API_KEY via password.")
-            return OpenAI(api_key=OPENAI_API_KEY)
+            return get_openai_client(OPENAI_API_KEY)
         except Exception as e:
             logger.warning("[chat.py] failed to build shared OpenAI client: %r", e)
 
@@ -108,7 +124,8 @@ def build_openai_client(
 # =========================
 #  helper: memory_context
 # =========================
-def build_memory_context(
+async def build_memory_context(
+    db: AsyncSession,
     user_id: uuid.UUID,
     bundle_ids: Optional[List[uuid.UUID]],
     selected_memory_ids: Optional[List[uuid.UUID]],
@@ -116,23 +133,65 @@ def build_memory_context(
     """
     selected_memory_ids가 비어있지 않으면 그 메모들만 사용.
     비어 있으면 bundle_ids 기준으로 기존 동작 유지.
+    - 같은 선택으로 대화를 이어가면 캐시된 결과 사용 (메모 변경 시 bundles.py 에서 무효화)
     """
-    db = SessionLocal()
+    if selected_memory_ids:
+        by_bundle, ids = False, selected_memory_ids
+    elif bundle_ids:
+        by_bundle, ids = True, bundle_ids
+    else:
+        # 아무것도 선택 안 했으면 memory_context 없음
+        return "", []
+
+    cached = await load_memory_context(user_id, by_bundle, ids)
+    if cached is not None:
+        obj = orjson.loads(cached)
+        return obj["text"], [UsedMemoryItem(**u) for u in obj["used"]]
+
+    context_text, used = await _query_memory_context(db, user_id, bundle_ids, selected_memory_ids)
+    await store_memory_context(
+        user_id,
+        by_bundle,
+        ids,
+        orjson.dumps({"text": context_text, "used": [u.model_dump() for u in used]}).decode(),
+    )
+    return context_text, used
+
+
+async def _query_memory_context(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    bundle_ids: Optional[List[uuid.UUID]],
+    selected_memory_ids: Optional[List[uuid.UUID]],
+) -> Tuple[str, List[UsedMemoryItem]]:
+    """build_memory_context 캐시 miss 시 DB 조회 + context 문자열 구성."""
     try:
-        q = db.query(models.MemoryItem).filter(models.MemoryItem.user_id == user_id)
+        # context 에 쓰는 컬럼만 읽음
+        # - 요약이 있으면 원문은 안 가져오고, 없을 때도 원문 앞부분만 (긴 붙여넣기 전체 전송 방지)
+        M = models.MemoryItem
+        text_col = func.coalesce(
+            func.nullif(M.summary, ""),
+            func.left(M.original_text, MAX_MEMORY_PER_ITEM_CHARS + 1),
+        ).label("text")
+        q = select(M.id, M.bundle_id, M.title, text_col).where(M.user_id == user_id)
 
         if selected_memory_ids:
             # ✅ 체크한 메모만 사용
-            q = q.filter(models.MemoryItem.id.in_(selected_memory_ids))
+            q = q.where(models.MemoryItem.id.in_(selected_memory_ids))
         elif bundle_ids:
             # 예전 방식: 번들 전체
-            q = q.filter(models.MemoryItem.bundle_id.in_(bundle_ids))
+            q = q.where(models.MemoryItem.bundle_id.in_(bundle_ids))
         else:
             # 아무것도 선택 안 했으면 memory_context 없음
             return "", []
 
-        q = q.order_by(models.MemoryItem.created_at.desc()).limit(MAX_MEMORY_ITEMS)
-        rows = q.all()
+        # 개수/길이 상한에 걸리면 고정(pinned) → 자주 쓰인 메모 → 최신 메모 순으로 남김
+        q = q.order_by(
+            M.is_pinned.desc(),
+            M.usage_count.desc(),
+            M.created_at.desc(),
+        ).limit(MAX_MEMORY_ITEMS)
+        rows = (await db.execute(q)).all()
 
         if not rows:
             return "", []
@@ -142,11 +201,8 @@ def build_memory_context(
         total_chars = 0
 
         for m in rows:
-            title = getattr(m, "title", None)
-            summary = getattr(m, "summary", None)
-            original_text = getattr(m, "original_text", "")
-
-            text_for_context = summary or original_text or ""
+            title = m.title
+            text_for_context = m.text or ""
             if len(text_for_context) > MAX_MEMORY_PER_ITEM_CHARS:
                 text_for_context = text_for_context[:MAX_MEMORY_PER_ITEM_CHARS] + "…"
 
@@ -178,19 +234,47 @@ def build_memory_context(
         return context_text, used
 
     except Exception as e:
+        await db.rollback()
         logger.exception("[chat.py] build_memory_context error: %r", e)
         return "", []
-    finally:
-        db.close()
+
+
+# 채팅 1턴 요약 + 키워드 프롬프트 (auto_route 용)
+# - 출력 형식은 response_format(json_schema, strict) 으로 강제
+CHAT_MEMORY_MODEL = "gpt-4.1-mini"
+CHAT_MEMORY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "당신은 대화 내용을 요약하고 키워드를 추출하는 도우미입니다.\n"
+        "- summary: 대화 1턴(사용자 메시지 + LLM 답변)의 핵심을 한국어 1~2문장으로\n"
+        "- keywords: 이 대화를 분류할 때 쓸 짧은 명사 키워드 3~5개"
+    ),
+}
+CHAT_MEMORY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "chat_memory",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summary": {"type": "string"},
+                "keywords": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["summary", "keywords"],
+            "additionalProperties": False,
+        },
+    },
+}
 
 
 # =========================
 #  helper: 요약 + 키워드
 # =========================
-def summarize_and_extract_keywords(
+async def summarize_and_extract_keywords(
     user_message: str,
     answer: str,
-    client: Optional[OpenAI],
+    client: Optional[AsyncOpenAI],
 ) -> Tuple[str, List[str]]:
     """
     채팅 1턴(사용자 메시지 + LLM 답변)을 요약하고 키워드 리스트를 뽑는다.
@@ -201,18 +285,17 @@ def summarize_and_extract_keywords(
         combined = f"사용자: {user_message}\n\nLLM: {answer}"
         summary = combined[:200]
         return summary, []
-    ...
-    # 나머지 로직은 그대로, client 사용
+
+    # 규칙/출력 형식은 고정 system 메시지 + response_format 에만 두고
+    # user 메시지에는 이번 대화 1턴만 (매 호출 같은 prefix → 프롬프트 캐시 대상)
     try:
-        resp = client.chat.completions.create(
-            model="gpt-4.1-mini",
+        resp = await client.chat.completions.create(
+            model=CHAT_MEMORY_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 대화 내용을 요약하고 키워드를 추출하는 도우미입니다.",
-                },
-                {"role": "user", "content": prompt},
+                CHAT_MEMORY_SYSTEM_MESSAGE,
+                {"role": "user", "content": f"사용자: {user_message}\n\nLLM: {answer}"},
             ],
+            response_format=CHAT_MEMORY_RESPONSE_FORMAT,
             max_tokens=256,
             temperature=0.2,
         )
@@ -240,80 +323,117 @@ def summarize_and_extract_keywords(
 # =========================
 #  helper: 번들 선택/생성
 # =========================
-def pick_or_create_bundle_for_chat(
+async def pick_or_create_bundle_for_chat(
+    db: AsyncSession,
     user_id: uuid.UUID,
     summary: str,
     keywords: List[str],
-) -> models.Bundle:
+) -> Row:
     """
     1) 유저의 번들들 중에서 키워드와 가장 잘 맞는 번들 고름
     2) 없으면 새 번들 생성
     (간단 문자열 매칭 버전)
+    - 매칭/저장에 필요한 (id, name, description) 만 읽고, 반환도 그 Row
     """
-    db = SessionLocal()
-    try:
-        bundles: List[models.Bundle] = (
-            db.query(models.Bundle)
-            .filter(models.Bundle.user_id == user_id, models.Bundle.is_archived == False)  # noqa: E712
-            .all()
-        )
+    result = await db.execute(
+        select(models.Bundle.id, models.Bundle.name, models.Bundle.description)
+        .where(models.Bundle.user_id == user_id, models.Bundle.is_archived == False)  # noqa: E712
+    )
+    bundles: List[Row] = result.all()
 
-        # 번들이 하나도 없으면 무조건 새로 생성
-        def _make_new_bundle() -> models.Bundle:
-            base_name = ""
-            if keywords:
-                base_name = keywords[0]
-            if not base_name:
-                base_name = summary[:20] or "자동 생성 번들"
+    # 번들이 하나도 없으면 무조건 새로 생성
+    async def _make_new_bundle() -> Row:
+        base_name = ""
+        if keywords:
+            base_name = keywords[0]
+        if not base_name:
+            base_name = summary[:20] or "자동 생성 번들"
 
-            new_bundle = models.Bundle(
+        result = await db.execute(
+            insert(models.Bundle)
+            .values(
                 user_id=user_id,
                 name=base_name,
                 description="자동 생성 (요약/키워드 기반)",
                 color="#4F46E5",
                 icon="📁",
             )
-            db.add(new_bundle)
-            db.commit()
-            db.refresh(new_bundle)
-            return new_bundle
+            .returning(models.Bundle.id, models.Bundle.name, models.Bundle.description)
+        )
+        new_bundle = result.one()
+        await db.commit()
+        return new_bundle
+
+    if not bundles:
+        return await _make_new_bundle()
 
-        if not bundles:
-            return _make_new_bundle()
+    lower_keywords = [k.lower() for k in keywords if k]
+    best_bundle: Optional[Row] = None
+    best_score = 0
 
-        lower_keywords = [k.lower() for k in keywords if k]
-        best_bundle: Optional[models.Bundle] = None
-        best_score = 0
+    for b in bundles:
+        text = ((b.name or "") + " " + (b.description or "")).lower()
+        score = 0
+        for kw in lower_keywords:
+            if kw and kw in text:
+                score += 1
 
-        for b in bundles:
-            text = ((b.name or "") + " " + (b.description or "")).lower()
-            score = 0
-            for kw in lower_keywords:
-                if kw and kw in text:
-                    score += 1
+        if score > best_score:
+            best_score = score
+            best_bundle = b
 
-            if score > best_score:
-                best_score = score
-                best_bundle = b
+    # 점수가 0이면 "관련 번들 없음"으로 보고 새로 생성
+    if best_bundle is None or best_score == 0:
+        return await _make_new_bundle()
 
-        # 점수가 0이면 "관련 번들 없음"으로 보고 새로 생성
-        if best_bundle is None or best_score == 0:
-            return _make_new_bundle()
+    return best_bundle
 
-        return best_bundle
 
-    finally:
-        db.close()
+# =========================
+#  helper: 메모 사용 기록
+# =========================
+async def record_memory_usage(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    used_memories: List[UsedMemoryItem],
+) -> None:
+    """
+    답변에 쓰인 메모들의 usage_count + 1, last_used_at 갱신 (UPDATE 한 번).
+    - 사용 기록은 메모 내용 수정이 아니므로 updated_at 은 그대로 둠
+    - 시각은 DB 의 now() (트랜잭션 시작 시각, 워커 시계와 무관)
+    - 실패해도 답변 흐름은 깨지지 않도록 예외는 위로 안 올림
+    """
+    if not used_memories:
+        return
+    M = models.MemoryItem
+    try:
+        await db.execute(
+            update(M)
+            .where(
+                M.user_id == user_id,
+                M.id.in_([uuid.UUID(m.id) for m in used_memories]),
+            )
+            .values(
+                usage_count=M.usage_count + 1,
+                last_used_at=func.now(),
+                updated_at=M.updated_at,
+            )
+        )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.warning("[chat.py] record_memory_usage failed (ignored): %r", e)
 
 
 # =========================
 #  helper: 자동 분류+저장
 # =========================
-def auto_route_and_save_chat_memory(
+async def auto_route_and_save_chat_memory(
+    db: AsyncSession,
     user_id: uuid.UUID,
     user_message: str,
     llm_answer: str,
-    client: Optional[OpenAI],
+    client: Optional[AsyncOpenAI],
 ) -> Optional[models.MemoryItem]:
     """
     1) 요약 + 키워드 추출
@@ -322,10 +442,9 @@ def auto_route_and_save_chat_memory(
 
     실패해도 전체 /chat 흐름은 깨지지 않도록 예외는 위로 안 올림.
     """
-    db = SessionLocal()
     try:
-        summary, keywords = summarize_and_extract_keywords(user_message, llm_answer, client)
-        bundle = pick_or_create_bundle_for_chat(user_id, summary, keywords)
+        summary, keywords = await summarize_and_extract_keywords(user_message, llm_answer, client)
+        bundle = await pick_or_create_bundle_for_chat(db, user_id, summary, keywords)
 
         original_text = f"사용자: {user_message}\n\nLLM: {llm_answer}"
 
@@ -338,22 +457,25 @@ def auto_route_and_save_chat_memory(
         else:
             title = "자동 요약 메모"
 
-        mem = models.MemoryItem(
-            user_id=user_id,
-            bundle_id=bundle.id,
-            title=title,
-            original_text=original_text,
-            summary=summary,
-            source_type="auto_chat",  # 필요시 enums 맞게 수정
-            source_id=None,
-            metadata_json={
-                "auto_routed": True,
-                "keywords": keywords,
-            },
+        mem = await db.scalar(
+            insert(models.MemoryItem)
+            .values(
+                user_id=user_id,
+                bundle_id=bundle.id,
+                title=title,
+                original_text=original_text,
+                summary=summary,
+                source_type="auto_chat",  # 필요시 enums 맞게 수정
+                source_id=None,
+                metadata_json={
+                    "auto_routed": True,
+                    "keywords": keywords,
+                },
+            )
+            .returning(models.MemoryItem)
         )
-        db.add(mem)
-        db.commit()
-        db.refresh(mem)
+        await db.commit()
+        await forget_memory_context(user_id, new_memory_only=True)
 
         logger.info(
             "[auto_route] saved memory id=%s into bundle id=%s (name=%s)",
@@ -363,34 +485,40 @@ def auto_route_and_save_chat_memory(
         )
         return mem
     except Exception as e:
+        await db.rollback()
         logger.exception("[chat.py] auto_route_and_save_chat_memory error: %r", e)
         return None
-    finally:
-        db.close()
 
 
 # =========================
-#         /chat
+#  helper: 프롬프트 구성 / 에러 응답
 # =========================
-@router.post("/chat", response_model=ChatResponse)
-async def chat_endpoint(
-    req: ChatRequest,
-    x_openai_key: Optional[str] = Header(None),
-    x_shared_api_password: Optional[str] = Header(None),
-) -> ChatResponse:
-    logger.info(
-        "[CHAT REQUEST] user_id=%s message=%r history_len=%d "
-        "selected_bundle_ids=%s selected_memory_ids=%s",
-        req.user_id,
-        req.message,
-        len(req.history),
-        req.selected_bundle_ids,
-        req.selected_memory_ids,
-    )
+CHAT_MODEL = "gpt-4.1-mini"
+CHAT_MAX_TOKENS = 512
+CHAT_TEMPERATURE = 0.7
+CHAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are an assistant that helps the user with their projects. "
+        "Answer in Korean by default unless the user uses another language."
+    ),
+}
 
-    # 요청마다 적절한 OpenAI 클라이언트 생성
-    client = build_openai_client(x_openai_key, x_shared_api_password)
+# 완전히 같은 요청(재시도/더블클릭)의 답변 재사용 시간
+CHAT_CACHE_TTL_SECONDS = 10 * 60
+
+# 워커당 동시에 진행 중인 채팅 LLM 호출 상한
+# - 몰릴 때 한꺼번에 보내 429 가 연쇄로 나는 대신 여기서 순서대로 대기
+# - 429 자체는 클라이언트(max_retries)가 backoff 하며 재시도
+CHAT_LLM_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "32"))
+_chat_llm_slots = asyncio.Semaphore(CHAT_LLM_CONCURRENCY)
 
+
+async def build_chat_messages(
+    db: AsyncSession,
+    req: ChatRequest,
+) -> Tuple[List[dict], str, List[UsedMemoryItem]]:
+    """/chat, /chat/stream 공용: (LLM messages, memory_context, used_memories)."""
     # history 슬라이싱
     if len(req.history) > MAX_HISTORY:
         history_for_llm = req.history[-MAX_HISTORY:]
@@ -404,33 +532,155 @@ async def chat_endpoint(
     )
 
     # memory_context 구성 (체크된 메모 기반)
-    memory_context_text, used_memories = build_memory_context(
+    memory_context_text, used_memories = await build_memory_context(
+        db,
         user_id=req.user_id,
         bundle_ids=req.selected_bundle_ids,
         selected_memory_ids=req.selected_memory_ids,
     )
 
-    # system 프롬프트
-    base_system_prompt = (
-        "You are an assistant that helps the user with their projects. "
-        "Answer in Korean by default unless the user uses another language."
-    )
-
+    # 고정 지시문은 항상 같은 첫 system 메시지, 매번 바뀌는 memory_context 는 그 뒤 별도 메시지
+    # → 요청마다 앞부분(prefix)이 같아서 OpenAI 프롬프트 캐시가 재사용 가능
+    messages = [CHAT_SYSTEM_MESSAGE]
     if memory_context_text:
-        system_content = (
-            f"{base_system_prompt}\n\n"
-            "[memory_context]\n"
-            f"{memory_context_text}\n"
-            "[/memory_context]"
+        messages.append(
+            {
+                "role": "system",
+                "content": f"[memory_context]\n{memory_context_text}\n[/memory_context]",
+            }
         )
-    else:
-        system_content = base_system_prompt
-
-    messages = [{"role": "system", "content": system_content}]
     for h in history_for_llm:
         messages.append({"role": h.role, "content": h.content})
     messages.append({"role": "user", "content": req.message})
 
+    # 디버그용 payload 로그 (내용은 그대로)
+    # - 프롬프트 전체를 직렬화하는 비용이 커서 DEBUG 가 켜져 있을 때만 만듦
+    # - 긴 history 에서 indent 출력은 크기/시간이 몇 배라 한 줄(orjson)로 찍음
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            logger.debug(
+                "[LLM REQUEST PAYLOAD] %s",
+                orjson.dumps(
+                    {
+                        "model": CHAT_MODEL,
+                        "messages": messages,
+                        "max_tokens": CHAT_MAX_TOKENS,
+                        "temperature": CHAT_TEMPERATURE,
+                    }
+                ).decode(),
+            )
+        except Exception:
+            pass
+
+    return messages, memory_context_text, used_memories
+
+
+def chat_error_answer(e: Exception, message: str) -> str:
+    """OpenAI 호출 실패 시 echo 모드 답변 (예외 종류별 접두어)."""
+    if isinstance(e, AuthenticationError):
+        logger.warning("[chat.py] AuthenticationError: %r", e)
+        return f"[AUTH_ERROR] API 키 인증 오류로 echo 모드로 응답합니다: {message}"
+    if isinstance(e, APIConnectionError):
+        logger.warning("[chat.py] APIConnectionError: %r", e)
+        return f"[NETWORK_ERROR] OpenAI 서버에 연결할 수 없어 echo 모드로 응답합니다: {message}"
+    if isinstance(e, APIStatusError):
+        logger.warning("[chat.py] APIStatusError: %r", e)
+        return f"[OPENAI_STATUS_ERROR] 상태코드={e.status_code}, echo: {message}"
+    logger.exception("[chat.py] UNKNOWN ERROR: %r", e)
+    return f"[UNKNOWN_ERROR] 서버 내부 오류로 echo 모드로 응답합니다: {message}"
+
+
+def _chat_context_hash(messages: List[dict]) -> str:
+    """질문(마지막 user 메시지)을 뺀 messages 해시 = 답변 캐시의 맥락 key."""
+    return hashlib.blake2b(orjson.dumps(messages[:-1]), digest_size=16).hexdigest()
+
+
+def _chat_cache_key(user_id: uuid.UUID, messages: List[dict]) -> str:
+    # 재시도/더블클릭처럼 messages 가 완전히 같은 요청용 (key = chat:{blake2b(모델|유저|messages)})
+    payload = orjson.dumps([CHAT_MODEL, str(user_id), messages])
+    return "chat:" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def find_cached_answer(
+    client: AsyncOpenAI,
+    user_id: uuid.UUID,
+    messages: List[dict],
+) -> Tuple[Optional[str], Optional[List[float]], str]:
+    """
+    캐시된 답변 찾기 → (답변, 질문 임베딩, 맥락 해시).
+    1) messages 가 완전히 같은 요청 (Redis / 프로세스 내 TTL 캐시, 임베딩 호출 없음)
+    2) semantic 캐시: 같은 맥락 + 거의 같은 질문
+    - pgvector 가 없거나 임베딩이 실패하면 임베딩은 None
+    - 못 찾았으면 LLM 답변을 받은 뒤 store_answer 로 두 캐시에 저장
+    """
+    exact = await cache_get(_chat_cache_key(user_id, messages))
+    if exact is not None:
+        logger.info("[chat.py] answer cache hit (exact)")
+        return exact, None, ""
+
+    if not semantic_cache.is_enabled():
+        return None, None, ""
+    context_hash = _chat_context_hash(messages)
+    embedding = await semantic_cache.embed_text(client, messages[-1]["content"])
+    if embedding is None:
+        return None, None, context_hash
+    answer = await semantic_cache.find_similar_answer(user_id, context_hash, embedding)
+    if answer is not None:
+        await cache_set(_chat_cache_key(user_id, messages), answer, CHAT_CACHE_TTL_SECONDS)
+    return answer, embedding, context_hash
+
+
+async def store_answer(
+    user_id: uuid.UUID,
+    messages: List[dict],
+    embedding: Optional[List[float]],
+    context_hash: str,
+    answer: str,
+) -> None:
+    """새 LLM 답변을 exact 캐시 (+ 임베딩이 있으면 semantic 캐시)에 저장."""
+    if not answer:
+        return
+    await cache_set(_chat_cache_key(user_id, messages), answer, CHAT_CACHE_TTL_SECONDS)
+    if embedding is not None:
+        await semantic_cache.store_answer(user_id, context_hash, embedding, answer)
+
+
+def _log_chat_request(req: ChatRequest) -> None:
+    # INFO 는 길이/개수만 (메시지 원문, id 목록 repr 은 요청 크기만큼 비용이 듦)
+    logger.info(
+        "[CHAT REQUEST] user_id=%s message_len=%d history_len=%d "
+        "selected_bundles=%d selected_memories=%d",
+        req.user_id,
+        len(req.message),
+        len(req.history),
+        len(req.selected_bundle_ids),
+        len(req.selected_memory_ids),
+    )
+    logger.debug(
+        "[CHAT REQUEST] message=%r selected_bundle_ids=%s selected_memory_ids=%s",
+        req.message,
+        req.selected_bundle_ids,
+        req.selected_memory_ids,
+    )
+
+
+# =========================
+#         /chat
+# =========================
+@router.post("/chat", response_model=ChatResponse)
+async def chat_endpoint(
+    req: ChatRequest,
+    x_openai_key: Optional[str] = Header(None),
+    x_shared_api_password: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+) -> ChatResponse:
+    _log_chat_request(req)
+
+    # 요청마다 적절한 OpenAI 클라이언트 생성
+    client = build_openai_client(x_openai_key, x_shared_api_password)
+
+    messages, memory_context_text, used_memories = await build_chat_messages(db, req)
+
     # � OpenAI 클라이언트가 없으면 echo 모드
     if client is None:
         logger.warning("[chat.py] No OpenAI client for this request. Echo mode.")
@@ -441,37 +691,34 @@ async def chat_endpoint(
             used_memories=used_memories,
         )
 
-    # 디버그용 payload 로그 (내용은 그대로)
-    try:
-        logger.info(
-            "[LLM REQUEST PAYLOAD]\n%s",
-            json.dumps(
-                {
-                  "model": "gpt-4.1-mini",
-                  "messages": messages,
-                  "max_tokens": 512,
-                  "temperature": 0.7,
-                },
-                ensure_ascii=False,
-                indent=2,
-            ),
+    # 같은 요청 / 같은 맥락에서 거의 같은 질문이면 캐시된 답변 (같은 대화 메모는 처음 답할 때 이미 저장됨)
+    cached, embedding, context_hash = await find_cached_answer(client, req.user_id, messages)
+    if cached is not None:
+        await record_memory_usage(db, req.user_id, used_memories)
+        return ChatResponse(
+            answer=cached,
+            memory_context=memory_context_text,
+            used_memories=used_memories,
         )
-    except Exception:
-        pass
 
     try:
-        completion = client.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=messages,
-            max_tokens=512,
-            temperature=0.7,
-        )
+        async with _chat_llm_slots:
+            completion = await client.chat.completions.create(
+                model=CHAT_MODEL,
+                messages=messages,
+                max_tokens=CHAT_MAX_TOKENS,
+                temperature=CHAT_TEMPERATURE,
+            )
         reply_text = completion.choices[0].message.content or ""
-        logger.info("[LLM RESPONSE] %r", reply_text)
+        logger.info("[LLM RESPONSE] len=%d", len(reply_text))
+        logger.debug("[LLM RESPONSE] %r", reply_text)
+        await store_answer(req.user_id, messages, embedding, context_hash, reply_text)
+        await record_memory_usage(db, req.user_id, used_memories)
 
         # ✅ 자동 분류 + 저장 (동일 client 사용)
         try:
-            auto_route_and_save_chat_memory(
+            await auto_route_and_save_chat_memory(
+                db,
                 user_id=req.user_id,
                 user_message=req.message,
                 llm_answer=reply_text,
@@ -485,33 +732,132 @@ async def chat_endpoint(
             memory_context=memory_context_text,
             used_memories=used_memories,
         )
-
-
-    except AuthenticationError as e:
-        logger.warning("[chat.py] AuthenticationError: %r", e)
-        return ChatResponse(
-            answer=f"[AUTH_ERROR] API 키 인증 오류로 echo 모드로 응답합니다: {req.message}",
-            memory_context=memory_context_text,
-            used_memories=used_memories,
-        )
-    except APIConnectionError as e:
-        logger.warning("[chat.py] APIConnectionError: %r", e)
+    except Exception as e:
         return ChatResponse(
-            answer=f"[NETWORK_ERROR] OpenAI 서버에 연결할 수 없어 echo 모드로 응답합니다: {req.message}",
+            answer=chat_error_answer(e, req.message),
             memory_context=memory_context_text,
             used_memories=used_memories,
         )
-    except APIStatusError as e:
-        logger.warning("[chat.py] APIStatusError: %r", e)
-        return ChatResponse(
-            answer=f"[OPENAI_STATUS_ERROR] 상태코드={e.status_code}, echo: {req.message}",
-            memory_context=memory_context_text,
-            used_memories=used_memories,
+
+
+# =========================
+#       /chat/stream
+# =========================
+def _sse(event: dict) -> bytes:
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream_endpoint(
+    req: ChatRequest,
+    x_openai_key: Optional[str] = Header(None),
+    x_shared_api_password: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    /chat 과 같은 요청/답변을 server-sent events 로 스트리밍.
+    - 토큰이 오는 대로 {"type": "delta", "content": "..."}
+    - 마지막에 /chat 응답과 같은 필드로 {"type": "done", "answer", "memory_context", "used_memories"}
+      (echo/에러 모드는 done 하나만)
+    - done 이 마지막 이벤트, 답변 캐시/사용 기록/자동 분류 + 저장은 응답을 다 보낸 뒤
+      BackgroundTask 로 (클라이언트가 기다리지 않고, 창을 닫아도 저장은 진행)
+    """
+    _log_chat_request(req)
+
+    client = build_openai_client(x_openai_key, x_shared_api_password)
+
+    # 메모 조회는 스트림 시작 전에 요청 세션으로 끝내고 커넥션 반환
+    # - yield 의존성(get_db)의 정리는 스트림이 끝난 뒤에야 돌아서, 그대로 두면
+    #   생성 내내 idle in transaction 으로 풀 커넥션을 하나 잡고 있음
+    messages, memory_context_text, used_memories = await build_chat_messages(db, req)
+    await db.close()
+    used_payload = [m.model_dump() for m in used_memories]
+
+    # 스트림이 채우고 응답 뒤 BackgroundTask 가 저장하는 결과
+    # - cache_hit: 사용 기록만 / reply: 답변 캐시 + 사용 기록 + 자동 분류
+    outcome: dict = {}
+
+    def done(answer: str) -> bytes:
+        return _sse(
+            {
+                "type": "done",
+                "answer": answer,
+                "memory_context": memory_context_text,
+                "used_memories": used_payload,
+            }
         )
-    except Exception as e:
-        logger.exception("[chat.py] UNKNOWN ERROR: %r", e)
-        return ChatResponse(
-            answer=f"[UNKNOWN_ERROR] 서버 내부 오류로 echo 모드로 응답합니다: {req.message}",
-            memory_context=memory_context_text,
-            used_memories=used_memories,
+
+    async def events():
+        if client is None:
+            logger.warning("[chat.py] No OpenAI client for this request. Echo mode.")
+            yield done(f"[NO_API_KEY] echo: {req.message}")
+            return
+
+        cached, embedding, context_hash = await find_cached_answer(
+            client, req.user_id, messages
         )
+        if cached is not None:
+            outcome["cache_hit"] = True
+            yield done(cached)
+            return
+
+        parts: List[str] = []
+        try:
+            # 스트림이 끝날 때까지 한 자리 차지 (클라이언트가 끊으면 generator 종료와 함께 반환)
+            async with _chat_llm_slots:
+                stream = await client.chat.completions.create(
+                    model=CHAT_MODEL,
+                    messages=messages,
+                    max_tokens=CHAT_MAX_TOKENS,
+                    temperature=CHAT_TEMPERATURE,
+                    stream=True,
+                )
+                # 클라이언트가 중간에 끊어도 upstream 스트림을 바로 닫음 (계속 생성/과금되지 않게)
+                async with stream:
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            parts.append(delta)
+                            yield _sse({"type": "delta", "content": delta})
+        except Exception as e:
+            yield done(chat_error_answer(e, req.message))
+            return
+
+        reply_text = "".join(parts)
+        logger.info("[LLM RESPONSE] len=%d (stream)", len(reply_text))
+        logger.debug("[LLM RESPONSE] %r", reply_text)
+        outcome.update(reply=reply_text, embedding=embedding, context_hash=context_hash)
+        yield done(reply_text)
+
+    async def persist() -> None:
+        # 응답을 다 보낸 뒤 실행, 요청 세션은 이미 닫았으므로 새 세션으로
+        if not outcome:
+            return
+        reply_text = outcome.get("reply")
+        if reply_text is not None:
+            await store_answer(
+                req.user_id, messages, outcome["embedding"], outcome["context_hash"], reply_text
+            )
+        try:
+            async with AsyncSessionLocal() as session:
+                await record_memory_usage(session, req.user_id, used_memories)
+                if reply_text is not None:
+                    await auto_route_and_save_chat_memory(
+                        session,
+                        user_id=req.user_id,
+                        user_message=req.message,
+                        llm_answer=reply_text,
+                        client=client,
+                    )
+        except Exception as e:
+            logger.warning("[chat.py] auto_route failed (ignored): %r", e)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 모아서 보내지 않도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(persist),
+    )
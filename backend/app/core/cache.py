@@ -0,0 +1,84 @@
+# app/core/cache.py
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger("app.cache")
+
+# 예: redis://127.0.0.1:6379/0  (없으면 캐시 없이 DB만 사용)
+REDIS_URL = os.getenv("REDIS_URL") or ""
+
+if REDIS_URL:
+    logger.info("[cache] REDIS_URL is set.")
+else:
+    logger.warning("[cache] REDIS_URL NOT set. 프로세스 내 LRU 캐시만 사용.")
+
+_redis: Optional[Redis] = None
+
+# Redis 가 없을 때 cache_get/cache_set 이 쓰는 프로세스 내 TTL LRU
+# - 워커끼리 공유는 안 되지만, 같은 원문 요약 같은 내용 기반(key=해시) 캐시는 그대로 맞음
+# - 유저 캐시(security.py)는 무효화가 워커 간에 맞아야 해서 여기 안 씀 (get_redis 직접 사용)
+LOCAL_CACHE_MAX_ITEMS = 4096
+_local_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+def get_redis() -> Optional[Redis]:
+    """
+    프로세스 전체에서 공유하는 Redis 클라이언트.
+    - REDIS_URL 이 없으면 None (호출하는 쪽에서 캐시를 건너뜀)
+    - 커넥션은 실제 명령을 보낼 때 lazy 하게 맺어짐
+    """
+    global _redis
+    if not REDIS_URL:
+        return None
+    if _redis is None:
+        _redis = Redis.from_url(REDIS_URL, decode_responses=True)
+    return _redis
+
+
+def _local_get(key: str) -> Optional[str]:
+    item = _local_cache.get(key)
+    if item is None:
+        return None
+    expires_at, value = item
+    if expires_at < time.monotonic():
+        del _local_cache[key]
+        return None
+    _local_cache.move_to_end(key)
+    return value
+
+
+def _local_set(key: str, value: str, ttl_seconds: int) -> None:
+    _local_cache[key] = (time.monotonic() + ttl_seconds, value)
+    _local_cache.move_to_end(key)
+    while len(_local_cache) > LOCAL_CACHE_MAX_ITEMS:
+        _local_cache.popitem(last=False)
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """문자열 캐시 조회. Redis 가 없으면 프로세스 내 LRU, Redis 가 실패하면 None (miss 취급)."""
+    redis = get_redis()
+    if redis is None:
+        return _local_get(key)
+    try:
+        return await redis.get(key)
+    except Exception as e:
+        logger.warning("[cache] get %s failed: %r", key, e)
+        return None
+
+
+async def cache_set(key: str, value: str, ttl_seconds: int) -> None:
+    """문자열 캐시 저장. Redis 가 없으면 프로세스 내 LRU, Redis 가 실패하면 무시."""
+    redis = get_redis()
+    if redis is None:
+        _local_set(key, value, ttl_seconds)
+        return
+    try:
+        await redis.setex(key, ttl_seconds, value)
+    except Exception as e:
+        logger.warning("[cache] set %s failed: %r", key, e)
@@ -0,0 +1,81 @@
+# app/core/context_cache.py
+
+import hashlib
+import logging
+from typing import List, Optional
+from uuid import UUID
+
+from app.core.cache import get_redis
+
+logger = logging.getLogger("app.context_cache")
+
+# /chat memory_context 캐시 (같은 메모/번들 선택으로 대화를 이어갈 때 DB 조회 생략)
+# - 유저별 Redis HASH 하나 (field = 선택 해시) → 무효화는 DEL 한 번으로 유저 단위
+# - 선택 방식별로 HASH 를 나눔:
+#   ids     = 체크한 메모 id 목록 → 새 메모가 생겨도 내용이 안 바뀜
+#   bundles = 번들 전체 → 새 메모가 생기면 바뀜
+# - 무효화가 워커끼리 맞아야 해서 프로세스 내 LRU fallback 은 쓰지 않음 (Redis 없으면 캐시 없음)
+# - usage_count 변경(순위)은 무효화하지 않음 → 최대 TTL 동안 이전 순서
+MEMORY_CONTEXT_CACHE_TTL_SECONDS = 60
+
+
+def _context_cache_key(user_id: UUID, by_bundle: bool) -> str:
+    return f"memctx:{user_id}:{'bundles' if by_bundle else 'ids'}"
+
+
+def _selection_field(ids: List[UUID]) -> str:
+    joined = ",".join(sorted(str(i) for i in ids))
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def load_memory_context(
+    user_id: UUID,
+    by_bundle: bool,
+    ids: List[UUID],
+) -> Optional[str]:
+    """캐시된 memory_context (직렬화된 문자열). 없거나 Redis 가 없으면 None."""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        return await redis.hget(_context_cache_key(user_id, by_bundle), _selection_field(ids))
+    except Exception as e:
+        logger.warning("[context_cache] load failed: %r", e)
+        return None
+
+
+async def store_memory_context(
+    user_id: UUID,
+    by_bundle: bool,
+    ids: List[UUID],
+    value: str,
+) -> None:
+    redis = get_redis()
+    if redis is None:
+        return
+    key = _context_cache_key(user_id, by_bundle)
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, _selection_field(ids), value)
+            pipe.expire(key, MEMORY_CONTEXT_CACHE_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("[context_cache] store failed: %r", e)
+
+
+async def forget_memory_context(user_id: UUID, *, new_memory_only: bool = False) -> None:
+    """
+    유저의 메모가 바뀌었을 때 호출.
+    - new_memory_only=True: 메모 추가만 (체크한 메모 기준 캐시는 그대로 유효)
+    - 그 외 (수정/삭제/요약 반영/번들 삭제): 전부 무효화
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    keys = [_context_cache_key(user_id, True)]
+    if not new_memory_only:
+        keys.append(_context_cache_key(user_id, False))
+    try:
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning("[context_cache] forget failed: %r", e)
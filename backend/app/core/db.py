@@ -1,12 +1,18 @@
 # app/core/db.py
 
+import logging
 import os
-from typing import Generator
+from typing import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session, declarative_base
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from dotenv import load_dotenv
 
+logger = logging.getLogger("app.db")
+
 # .env 읽기
 load_dotenv()
 
@@ -15,11 +21,45 @@ if not DATABASE_URL:
     # 최소한 에러라도 분명하게 내자
     raise RuntimeError("DATABASE_URL 환경변수가 설정되지 않았습니다 (.env 확인).")
 
-# SQLAlchemy 엔진 생성
+# 비동기 엔드포인트용 URL (postgresql+psycopg2://... → postgresql+asyncpg://...)
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+# 커넥션 풀 설정 (비동기 엔진)
+# - 기본값(size=5, overflow=10)은 동시 요청이 몰리면 풀 대기가 생김
+# - pool_pre_ping: 끊어진 커넥션(DB 재시작, 방화벽 idle timeout)을 조용히 교체
+# - pool_recycle: 오래된 커넥션 주기적으로 새로 맺기 (초)
+# - pool_use_lifo: 최근에 쓴 커넥션부터 재사용 → 남는 커넥션은 idle 로 정리됨
+# - pool_timeout: 풀이 꽉 찼을 때 빈 커넥션을 기다리는 최대 시간 (초, 넘으면 에러)
+# - 프로세스당 최대 size + overflow = 40 커넥션 (Postgres 기본 max_connections=100)
+#   워커를 여러 개 띄우면 워커 수 x 40 이 max_connections 를 넘지 않게 env 로 조절
+POOL_OPTIONS = dict(
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    pool_pre_ping=True,
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    pool_use_lifo=True,
+)
+
+# SQL 로그 (모든 쿼리를 INFO 로 찍어서 요청마다 비용이 큼) → 필요할 때만 DB_ECHO=1
+DB_ECHO = os.getenv("DB_ECHO", "").lower() in ("1", "true", "yes")
+
+# SQLAlchemy 엔진 생성 (동기: init_db 스키마 생성/업그레이드용)
+# - 시작할 때 한 번만 쓰므로 풀을 유지하지 않음 (NullPool)
 engine = create_engine(
     DATABASE_URL,
-    echo=True,      # 처음에는 SQL 로그 보려고 True, 나중에 시끄러우면 False
+    echo=DB_ECHO,
     future=True,
+    poolclass=NullPool,
+)
+
+# 비동기 엔진 (FastAPI 엔드포인트용)
+# - poolclass 를 명시해서 NullPool 등으로 바뀌어 요청마다 접속하는 일이 없게 고정
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=DB_ECHO,
+    poolclass=AsyncAdaptedQueuePool,
+    **POOL_OPTIONS,
 )
 
 # 세션 팩토리
@@ -29,24 +69,99 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# 비동기 세션 팩토리
+# - commit 후 속성이 expire 되면 async 에서는 lazy load 가 안 되므로 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base 클래스 (모든 모델이 이걸 상속)
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI Depends(...)에서 쓰는 DB 세션 의존성.
-    예: db: Session = Depends(get_db)
+    예: db: AsyncSession = Depends(get_db)
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+# create_all 은 이미 존재하는 테이블을 변경하지 않으므로,
+# 기존 DB 에도 반영해야 하는 스키마 변경은 여기에 (여러 번 실행해도 안전한 SQL 만)
+SCHEMA_UPGRADES = [
+    # memory_items.bundle_id FK 에 ON DELETE CASCADE 추가 (번들 삭제 시 메모도 DB 에서 같이 삭제)
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM pg_constraint
+            WHERE conname = 'memory_items_bundle_id_fkey' AND confdeltype <> 'c'
+        ) THEN
+            ALTER TABLE memory_items DROP CONSTRAINT memory_items_bundle_id_fkey;
+            ALTER TABLE memory_items ADD CONSTRAINT memory_items_bundle_id_fkey
+                FOREIGN KEY (bundle_id) REFERENCES bundles(id) ON DELETE CASCADE;
+        END IF;
+    END $$;
+    """,
+    # 목록 조회(필터 + keyset 정렬 created_at DESC, id DESC)용 복합 인덱스
+    "CREATE INDEX IF NOT EXISTS ix_bundles_user_arch_created_id "
+    "ON bundles (user_id, is_archived, created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_memory_bundle_created_id "
+    "ON memory_items (bundle_id, created_at DESC, id DESC)",
+    # id 가 없던 이전 인덱스는 위 인덱스로 대체
+    "DROP INDEX IF EXISTS ix_bundles_user_arch_created",
+    "DROP INDEX IF EXISTS ix_memory_bundle_created",
+    # 백그라운드/배치 요약 진행 상태
+    "ALTER TABLE memory_items ADD COLUMN IF NOT EXISTS summary_status VARCHAR(20)",
+    "ALTER TABLE memory_items ADD COLUMN IF NOT EXISTS summary_batch_id VARCHAR(64)",
+    # 번들 트리/하위 번들 탐색 (user_id, parent_id) + 형제 정렬
+    "CREATE INDEX IF NOT EXISTS ix_bundles_user_parent_created_id "
+    "ON bundles (user_id, parent_id, created_at DESC, id DESC)",
+    # /chat memory_context 순위 (pinned → usage → 최신) 를 정렬 없이 인덱스 순서로
+    "CREATE INDEX IF NOT EXISTS ix_memory_bundle_rank "
+    "ON memory_items (bundle_id, is_pinned DESC, usage_count DESC, created_at DESC)",
+    # summary batch sync 조회 (배치로 보낸 메모만)
+    "CREATE INDEX IF NOT EXISTS ix_memory_user_summary_batch "
+    "ON memory_items (user_id, summary_batch_id) WHERE summary_batch_id IS NOT NULL",
+]
+
+
+# pgvector 확장이 있으면 True (init_db 에서 결정, summary / chat semantic 캐시 on/off)
+PGVECTOR_AVAILABLE = False
+
+# pgvector 가 없으면 만들지 않는 테이블
+PGVECTOR_TABLES = {"summary_cache", "chat_answer_cache"}
+
+
+def _enable_pgvector() -> bool:
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        return True
+    except Exception as e:
+        logger.warning("[db] pgvector extension unavailable, semantic cache disabled: %r", e)
+        return False
 
 
 # 컨테이너화에 의한 새로운 db생성 로직
 def init_db():
+    global PGVECTOR_AVAILABLE
+
     # 반드시 models 를 import 해서 Base.metadata 에 테이블들이 등록되게 해줘야 함
     from app import models  # or from app.models import *  (네 구조에 맞게)
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+
+    PGVECTOR_AVAILABLE = _enable_pgvector()
+    tables = [
+        t
+        for t in Base.metadata.sorted_tables
+        if PGVECTOR_AVAILABLE or t.name not in PGVECTOR_TABLES
+    ]
+    Base.metadata.create_all(bind=engine, tables=tables)
+
+    with engine.begin() as conn:
+        for stmt in SCHEMA_UPGRADES:
+            conn.execute(text(stmt))
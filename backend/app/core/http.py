@@ -0,0 +1,57 @@
+# app/core/http.py
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# OpenAI 호출에 공통으로 쓰는 httpx 커넥션 풀
+# - API 키마다 OpenAI 클라이언트는 따로 만들지만, 키는 요청 헤더에만 들어가므로
+#   TCP/TLS 커넥션(HTTP/2 멀티플렉싱)은 프로세스 전체에서 하나의 풀을 공유
+# - DefaultAsyncHttpxClient 는 SDK 기본값(timeout, redirect 등)을 유지한 httpx 클라이언트
+# - 요약/정리/채팅이 한꺼번에 몰려도 풀 대기가 안 생기도록 여유 있게 잡음
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+# SDK 기본 read timeout(600초)은 막힌 요청이 너무 오래 커넥션/태스크를 잡고 있음
+# - read 는 청크 사이 간격 기준이라 스트리밍 응답에도 60초면 충분
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# 429 / 5xx / 커넥션 오류 재시도 횟수 (SDK 기본 2)
+# - SDK 가 지수 backoff + jitter 로 재시도하고, Retry-After 헤더가 있으면 그 값을 따름
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
+
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """AsyncOpenAI(http_client=...) 용 (bundles 요약/정리, /chat)."""
+    global _async_client
+    if _async_client is None:
+        _async_client = DefaultAsyncHttpxClient(
+            http2=True,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+        )
+    return _async_client
+
+
+# 키별로 클라이언트를 재사용 + 모든 키가 같은 httpx 커넥션 풀(TLS/HTTP2)을 공유
+# - bundles / chat 이 같은 캐시를 써서 같은 키면 같은 객체 (요약 micro-batch key 로도 사용)
+@lru_cache(maxsize=128)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=get_async_http_client(),
+        max_retries=OPENAI_MAX_RETRIES,
+    )
+
+
+async def close_http_clients() -> None:
+    """앱 종료 시 커넥션 정리."""
+    global _async_client
+    get_openai_client.cache_clear()
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
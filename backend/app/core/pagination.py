@@ -0,0 +1,26 @@
+# app/core/pagination.py
+
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+
+# 목록 API 공통 (keyset 페이지네이션)
+# - 정렬: created_at DESC, id DESC
+# - 커서: 마지막 행의 "created_at|id"
+#   (한 트랜잭션에서 만든 행은 created_at(now()) 이 같을 수 있어서 id 로 tie-break)
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    return f"{created_at.isoformat()}|{row_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        created_at, row_id = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
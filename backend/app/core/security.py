@@ -1,32 +1,56 @@
 # app/core/security.py
 
+import json
+import logging
 import os
+import time
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_redis
 from app.core.db import get_db
 from app.models.user import User
 
+logger = logging.getLogger("app.security")
+
 # 환경변수
 SECRET_KEY = os.getenv("SECRET_KEY", "changeme")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
+# get_current_user 캐시 유지 시간 상한 (토큰 수명보다 짧게)
+# - 캐시를 지우는 경로(로그아웃/비활성화 API)가 없으므로, DB 에서 is_active 를 바꾸면
+#   최대 이 시간 뒤에는 다시 DB 조회로 반영됨
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+
 # 🔐 비밀번호 해싱 컨텍스트
-# bcrypt / bcrypt_sha256 대신 pbkdf2_sha256 사용
-# - 순수 파이썬 구현이라 bcrypt 모듈 버그 영향 없음
-# - 비밀번호 길이 제한 문제도 신경 안 써도 됨
+# 새 해시는 Argon2id (memory=64MB / iterations=3 / parallelism=2)
+# - pbkdf2_sha256 보다 GPU 공격에 강하고, 해시 1회 100ms 이하
+# - 기존 pbkdf2_sha256 해시도 검증 가능 (deprecated → 로그인 성공 시 argon2 로 재해시)
+# - bcrypt 는 여전히 사용하지 않음 (bcrypt 모듈 버그 / 72바이트 길이 제한)
 pwd_context = CryptContext(
-    schemes=["pbkdf2_sha256"],
+    schemes=["argon2", "pbkdf2_sha256"],
     deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=65536,
+    argon2__time_cost=3,
+    argon2__parallelism=2,
 )
 
+# 존재하지 않는 이메일로 로그인할 때도 같은 해시 검증 비용을 쓰기 위한 더미 해시
+# (응답 시간 차이로 가입 여부가 드러나지 않게)
+DUMMY_PASSWORD_HASH = pwd_context.hash("dummy-password-for-timing")
+
 # /auth/login 에서 토큰 발급한다고 명시 (Swagger/OpenAPI 용)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
@@ -35,6 +59,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 + 해시 업그레이드.
+    - (검증 결과, 새 해시) 반환
+    - 예전 스킴/파라미터 해시면 새 해시를 돌려주므로 호출하는 쪽에서 저장
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -48,14 +84,100 @@ def create_access_token(
         expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode.update({"exp": expire})
+    # 토큰별 캐시 키(user:{jti})로 쓰는 고유 id
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def get_current_user(
+# -------------------------
+# 인증 유저 캐시 (Redis, key = user:{jti})
+# -------------------------
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """
+    인증 체크용 가벼운 유저 정보.
+    - ORM 객체가 아니라서 세션/identity map 없이 캐시에서 바로 복원 가능
+    - UserOut(from_attributes=True) 로 그대로 응답 가능
+    """
+
+    id: UUID
+    email: str
+    username: Optional[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "id": str(self.id),
+                "email": self.email,
+                "username": self.username,
+                "is_active": self.is_active,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CurrentUser":
+        data = json.loads(raw)
+        return cls(
+            id=UUID(data["id"]),
+            email=data["email"],
+            username=data["username"],
+            is_active=data["is_active"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
+
+def _user_cache_key(jti: str) -> str:
+    return f"user:{jti}"
+
+
+async def cache_current_user(jti: str, user: CurrentUser, ttl_seconds: int) -> None:
+    """토큰 jti 기준으로 유저 정보 저장 (최대 USER_CACHE_TTL_SECONDS). Redis 가 없거나 실패해도 무시."""
+    ttl_seconds = min(ttl_seconds, USER_CACHE_TTL_SECONDS)
+    redis = get_redis()
+    if redis is None or ttl_seconds <= 0:
+        return
+    try:
+        await redis.setex(_user_cache_key(jti), ttl_seconds, user.to_json())
+    except Exception as e:
+        logger.warning("[security] cache_current_user failed: %r", e)
+
+
+async def _load_cached_user(jti: str) -> Optional[CurrentUser]:
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        raw = await redis.get(_user_cache_key(jti))
+        return CurrentUser.from_json(raw) if raw else None
+    except Exception as e:
+        logger.warning("[security] cached user lookup failed: %r", e)
+        return None
+
+
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+    db: AsyncSession = Depends(get_db),
+) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -67,11 +189,29 @@ def get_current_user(
         user_id: str | None = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+        user_uuid = UUID(user_id)
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    # 1) Redis 캐시 (jti 없는 예전 토큰은 바로 DB 조회)
+    jti: str | None = payload.get("jti")
+    if jti:
+        cached = await _load_cached_user(jti)
+        if cached is not None and cached.id == user_uuid:
+            if not cached.is_active:
+                raise credentials_exception
+            return cached
+
+    # 2) 캐시 miss → DB 조회 후 캐시 (남은 토큰 수명과 USER_CACHE_TTL_SECONDS 중 짧은 쪽)
+    result = await db.execute(select(User).where(User.id == user_uuid))
+    user = result.scalar_one_or_none()
     if user is None or not user.is_active:
         raise credentials_exception
 
-    return user
+    current_user = CurrentUser.from_user(user)
+    if jti:
+        exp = payload.get("exp")
+        ttl = int(exp - time.time()) if exp else 0
+        await cache_current_user(jti, current_user, ttl)
+
+    return current_user
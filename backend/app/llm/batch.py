@@ -0,0 +1,91 @@
+# app/llm/batch.py
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from openai import AsyncOpenAI
+
+logger = logging.getLogger("app.llm.batch")
+
+# OpenAI Batch API (비용 50% 할인, 최대 24시간 안에 처리)
+# - 요청은 JSONL 파일 하나로 업로드하고, 결과도 JSONL 파일로 받음
+# - custom_id 로 요청/결과를 매칭
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+# 더 기다려도 결과가 안 나오는 상태
+BATCH_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+
+@dataclass
+class BatchResult:
+    status: str
+    # custom_id → 응답 content (실패한 요청은 None). 아직 안 끝났으면 None
+    outputs: Optional[Dict[str, Optional[str]]] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status == "completed" or self.status in BATCH_FAILED_STATUSES
+
+
+async def submit_chat_batch(
+    client: AsyncOpenAI,
+    requests: List[Tuple[str, dict]],
+    metadata: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    (custom_id, chat.completions body) 목록을 배치로 제출하고 batch_id 반환.
+    - 실패하면 예외를 그대로 올림 (호출하는 쪽에서 즉시 처리로 fallback)
+    """
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": body,
+            },
+            ensure_ascii=False,
+        )
+        for custom_id, body in requests
+    ]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    input_file = await client.files.create(
+        file=("batch_input.jsonl", payload),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+        metadata=metadata,
+    )
+    logger.info("[batch] submitted batch_id=%s requests=%d", batch.id, len(requests))
+    return batch.id
+
+
+async def fetch_batch_result(client: AsyncOpenAI, batch_id: str) -> BatchResult:
+    """배치 상태 조회. completed 면 결과 파일까지 읽어서 custom_id 별 content 반환."""
+    batch = await client.batches.retrieve(batch_id)
+    if batch.status != "completed":
+        return BatchResult(status=batch.status)
+
+    outputs: Dict[str, Optional[str]] = {}
+    if batch.output_file_id:
+        content = await client.files.content(batch.output_file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            content_text = None
+            if response.get("status_code") == 200:
+                choices = (response.get("body") or {}).get("choices") or []
+                if choices:
+                    content_text = (choices[0].get("message") or {}).get("content")
+            outputs[item["custom_id"]] = content_text
+
+    return BatchResult(status=batch.status, outputs=outputs)
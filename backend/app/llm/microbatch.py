@@ -0,0 +1,77 @@
+# app/llm/microbatch.py
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, List, Set, Tuple
+
+logger = logging.getLogger("app.llm.microbatch")
+
+
+class MicroBatcher:
+    """
+    같은 key 로 짧은 시간(window_seconds) 안에 들어온 요청을 모아서 handler 한 번으로 처리.
+    - key 는 보통 (OpenAI 클라이언트, 모델, 유저) (한 호출에 섞어도 되는 요청끼리만 같은 key)
+    - max_items 만큼 모이면 window 를 기다리지 않고 바로 처리
+    - handler(key, items) 는 items 와 같은 순서/길이의 결과 리스트를 반환해야 함
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Hashable, List], Awaitable[List]],
+        max_items: int = 8,
+        window_seconds: float = 0.05,
+    ):
+        self._handler = handler
+        self._max_items = max_items
+        self._window_seconds = window_seconds
+        self._pending: Dict[Hashable, List[Tuple[object, asyncio.Future]]] = {}
+        # 실행 중인 flush task 참조 유지 (GC 로 중간에 사라지지 않게)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        bucket = self._pending.get(key)
+        if bucket is None:
+            bucket = self._pending[key] = []
+            loop.call_later(self._window_seconds, self._flush, key, bucket)
+        bucket.append((item, future))
+
+        if len(bucket) >= self._max_items:
+            self._flush(key, bucket)
+
+        # 기다리던 요청이 취소돼도 같은 배치의 다른 요청 결과는 그대로 나오게
+        return await asyncio.shield(future)
+
+    def _flush(self, key: Hashable, bucket: List[Tuple[object, asyncio.Future]]) -> None:
+        # max_items 로 먼저 처리된 bucket 의 타이머가 늦게 울리면 무시
+        if self._pending.get(key) is not bucket:
+            return
+        del self._pending[key]
+
+        task = asyncio.get_running_loop().create_task(self._run(key, bucket))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, bucket: List[Tuple[object, asyncio.Future]]) -> None:
+        items = [item for item, _ in bucket]
+        try:
+            results = await self._handler(key, items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"handler returned {len(results)} results for {len(items)} items"
+                )
+            for (_, future), result in zip(bucket, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            logger.warning("[microbatch] handler failed (items=%d): %r", len(items), e)
+            for _, future in bucket:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # handler 가 취소되는 등 결과를 못 받은 요청이 submit 에서 영원히 기다리지 않게
+            for _, future in bucket:
+                if not future.done():
+                    future.set_exception(RuntimeError("micro-batch aborted"))
@@ -0,0 +1,153 @@
+# app/llm/semantic_cache.py
+
+import logging
+from datetime import timedelta
+from typing import List, Optional
+from uuid import UUID
+
+from openai import AsyncOpenAI
+from sqlalchemy import func, select
+
+from app.core import db as core_db
+from app.core.db import AsyncSessionLocal
+from app.models.chat_answer_cache import ChatAnswerCache
+from app.models.summary_cache import EMBEDDING_DIM, SummaryCache
+
+logger = logging.getLogger("app.semantic_cache")
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# 코사인 거리 (1 - 유사도). 0.05 → 유사도 0.95 이상만 hit
+# 너무 느슨하면 내용이 다른 메모에 엉뚱한 요약이 붙으므로 보수적으로 유지
+MAX_COSINE_DISTANCE = 0.05
+
+# /chat 답변 캐시는 temperature 0.7 답변을 재사용하는 것이라 요약보다 더 엄격하게
+# (유사도 0.97 이상), 오래된 답변은 쓰지 않음
+CHAT_MAX_COSINE_DISTANCE = 0.03
+CHAT_CACHE_MAX_AGE_SECONDS = 60 * 60 * 24
+
+# 임베딩 입력 길이 제한 (모델 입력 토큰 한도보다 충분히 작게, 문자 기준)
+EMBED_MAX_CHARS = 6000
+
+
+def is_enabled() -> bool:
+    """pgvector 가 있어서 init_db 가 summary_cache / chat_answer_cache 테이블을 만든 경우에만 사용."""
+    return core_db.PGVECTOR_AVAILABLE
+
+
+async def embed_text(client: AsyncOpenAI, text: str) -> Optional[List[float]]:
+    """원문 임베딩. 실패하면 None (캐시 없이 그냥 요약)."""
+    try:
+        resp = await client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=text[:EMBED_MAX_CHARS],
+            dimensions=EMBEDDING_DIM,
+        )
+        return resp.data[0].embedding
+    except Exception as e:
+        logger.warning("[semantic_cache] embedding failed: %r", e)
+        return None
+
+
+async def find_similar_summary(
+    user_id: UUID,
+    embedding: List[float],
+) -> Optional[str]:
+    """이 유저의 캐시 중 가장 가까운 요약 (거리 ≤ MAX_COSINE_DISTANCE 일 때만)."""
+    distance = SummaryCache.embedding.cosine_distance(embedding)
+    try:
+        async with AsyncSessionLocal() as db:
+            row = (
+                await db.execute(
+                    select(SummaryCache.summary, distance.label("distance"))
+                    .where(SummaryCache.user_id == user_id)
+                    .order_by(distance)
+                    .limit(1)
+                )
+            ).first()
+    except Exception as e:
+        logger.warning("[semantic_cache] lookup failed: %r", e)
+        return None
+
+    if row is None or row.distance > MAX_COSINE_DISTANCE:
+        return None
+
+    logger.info("[semantic_cache] hit. distance=%.4f", row.distance)
+    return row.summary
+
+
+async def store_summary(
+    user_id: UUID,
+    text_hash: str,
+    embedding: List[float],
+    summary: str,
+) -> None:
+    """새로 만든 요약을 임베딩과 함께 저장. 실패해도 무시."""
+    try:
+        async with AsyncSessionLocal() as db:
+            db.add(
+                SummaryCache(
+                    user_id=user_id,
+                    text_hash=text_hash,
+                    embedding=embedding,
+                    summary=summary,
+                )
+            )
+            await db.commit()
+    except Exception as e:
+        logger.warning("[semantic_cache] store failed: %r", e)
+
+
+async def find_similar_answer(
+    user_id: UUID,
+    context_hash: str,
+    embedding: List[float],
+) -> Optional[str]:
+    """같은 맥락에서 거의 같은 질문에 했던 답변 (거리 ≤ CHAT_MAX_COSINE_DISTANCE 일 때만)."""
+    distance = ChatAnswerCache.embedding.cosine_distance(embedding)
+    try:
+        async with AsyncSessionLocal() as db:
+            row = (
+                await db.execute(
+                    select(ChatAnswerCache.answer, distance.label("distance"))
+                    .where(
+                        ChatAnswerCache.user_id == user_id,
+                        ChatAnswerCache.context_hash == context_hash,
+                        ChatAnswerCache.created_at
+                        > func.now() - timedelta(seconds=CHAT_CACHE_MAX_AGE_SECONDS),
+                    )
+                    .order_by(distance)
+                    .limit(1)
+                )
+            ).first()
+    except Exception as e:
+        logger.warning("[semantic_cache] chat lookup failed: %r", e)
+        return None
+
+    if row is None or row.distance > CHAT_MAX_COSINE_DISTANCE:
+        return None
+
+    logger.info("[semantic_cache] chat hit. distance=%.4f", row.distance)
+    return row.answer
+
+
+async def store_answer(
+    user_id: UUID,
+    context_hash: str,
+    embedding: List[float],
+    answer: str,
+) -> None:
+    """새 /chat 답변을 질문 임베딩과 함께 저장. 실패해도 무시."""
+    try:
+        async with AsyncSessionLocal() as db:
+            db.add(
+                ChatAnswerCache(
+                    user_id=user_id,
+                    context_hash=context_hash,
+                    embedding=embedding,
+                    answer=answer,
+                )
+            )
+            await db.commit()
+    except Exception as e:
+        logger.warning("[semantic_cache] chat store failed: %r", e)
@@ -0,0 +1,49 @@
+# app/llm/tokens.py
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger("app.llm.tokens")
+
+# gpt-4.1 / gpt-4o 계열 토크나이저
+ENCODING_NAME = "o200k_base"
+
+TRUNCATION_MARKER = "\n...[중략]...\n"
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    tiktoken 인코딩 로드 (프로세스당 1번).
+    - 처음 쓸 때 BPE 파일을 내려받으므로, 설치가 안 됐거나 오프라인이면 None
+      → 문자 수 기준으로 자름 (한국어는 대략 1글자 ≤ 1토큰이라 보수적인 근사)
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(ENCODING_NAME)
+    except Exception as e:
+        logger.warning("[tokens] tiktoken unavailable, fallback to char-based truncation: %r", e)
+        return None
+
+
+def truncate_middle(text: str, max_tokens: int) -> str:
+    """
+    max_tokens 를 넘으면 앞/뒤 절반씩만 남기고 가운데를 잘라냄.
+    (긴 로그/대화는 보통 앞쪽에 맥락, 뒤쪽에 결론이 있어서 head + tail 유지)
+    """
+    if len(text.encode("utf-8")) <= max_tokens:
+        # 토큰은 최소 1바이트 → UTF-8 바이트 수 이하면 인코딩할 필요 없음
+        return text
+
+    enc = _get_encoding()
+    half = max_tokens // 2
+    if enc is None:
+        if len(text) <= max_tokens:
+            return text
+        return text[:half] + TRUNCATION_MARKER + text[-half:]
+
+    ids = enc.encode(text, disallowed_special=())
+    if len(ids) <= max_tokens:
+        return text
+    return enc.decode(ids[:half]) + TRUNCATION_MARKER + enc.decode(ids[-half:])
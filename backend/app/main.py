@@ -1,22 +1,31 @@
 # app/main.py
 from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import bundles, chat, auth
-from app.core.db import init_db, Base, engine
+from app.core.db import init_db
+from app.core.http import close_http_clients
 from app import models  # noqa: F401  # Base.metadata에 모델 등록용
 
 app = FastAPI(
     title="Bundle-based LLM Memory API",
     version="0.1.0",
+    # 응답 JSON 직렬화는 orjson (UUID/datetime/dict 를 C 로 바로 처리)
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.on_event("startup")
 def on_startup() -> None:
-    # DB 초기화 및 테이블 생성
+    # DB 초기화 및 테이블 생성 (create_all 포함)
     init_db()
-    Base.metadata.create_all(bind=engine)
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    # OpenAI 호출용 공용 httpx 커넥션 풀 정리
+    await close_http_clients()
 
 
 # CORS 설정
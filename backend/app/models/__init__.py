@@ -3,5 +3,8 @@
 from .user import User
 from .bundle import Bundle
 from .memory_item import MemoryItem
+from .summary_cache import SummaryCache
+from .auto_group_job import AutoGroupJob
+from .chat_answer_cache import ChatAnswerCache
 
-__all__ = ["User", "Bundle", "MemoryItem"]
+__all__ = ["User", "Bundle", "MemoryItem", "SummaryCache", "AutoGroupJob", "ChatAnswerCache"]
@@ -0,0 +1,46 @@
+# app/models/auto_group_job.py
+
+from uuid import uuid4
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+
+from app.core.db import Base
+
+
+class AutoGroupJob(Base):
+    """
+    번들 자동 정리를 OpenAI Batch API 로 맡긴 작업.
+    - status 는 OpenAI batch 상태를 그대로 저장 (validating / in_progress / completed / failed ...)
+    - 끝나면 groups 에 미리보기와 같은 형식([{parent_name, child_bundle_ids}])으로 결과 저장
+    """
+
+    __tablename__ = "auto_group_jobs"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # 번들이 너무 적어서 배치 없이 바로 끝난 작업은 None
+    batch_id = Column(String(64), nullable=True)
+    status = Column(String(20), nullable=False)
+    groups = Column(JSONB, nullable=True)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=text("now()"),
+    )
+
+    __table_args__ = (
+        Index("ix_auto_group_jobs_user", "user_id"),
+    )
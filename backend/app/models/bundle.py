@@ -1,8 +1,8 @@
 # app/models/bundle.py
 
-from sqlalchemy import Column, String, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, Boolean, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 from sqlalchemy.sql import func
 
 from app.core.db import Base
@@ -46,18 +46,50 @@ class Bundle(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=func.now(),
+        # update() 문에 SET updated_at = now() 를 자동으로 붙임 (DB 트리거 없음)
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        # list_bundles: WHERE user_id = ? AND is_archived = false
+        #   AND (created_at, id) < cursor ORDER BY created_at DESC, id DESC
+        Index(
+            "ix_bundles_user_arch_created_id",
+            "user_id",
+            "is_archived",
+            created_at.desc(),
+            id.desc(),
+        ),
+        # /bundles/tree, delete_bundle 재귀 CTE: JOIN child.parent_id = 상위 id AND user_id = ?
+        #   + 트리 정렬용 row_number() OVER (PARTITION BY parent_id ORDER BY created_at DESC, id DESC)
+        Index(
+            "ix_bundles_user_parent_created_id",
+            "user_id",
+            "parent_id",
+            created_at.desc(),
+            id.desc(),
+        ),
     )
 
     # self-referential 관계 (폴더/하위 폴더 구조)
+    # - BundleOut 은 parent_id 만 내보내므로 관계는 응답에서 안 씀
+    # - lazy="raise": 목록 직렬화 중 실수로 접근해도 번들마다 SELECT(N+1) 대신 바로 에러
+    #   (필요하면 options(selectinload(Bundle.children)) 로 명시)
     parent = relationship(
         "Bundle",
         remote_side=[id],
-        backref="children",
+        backref=backref("children", lazy="raise"),
+        lazy="raise",
     )
 
-    # MemoryItem 쪽에서 back_populates="bundle" 사용 중
+    # MemoryItem.bundle 과 양방향 (back_populates)
+    # - lazy="raise": bundle.memories 를 그냥 접근하면 N+1 대신 바로 에러
+    #   → 필요한 쿼리에서 options(selectinload(Bundle.memories)) 로 IN (...) 한 번에 로드
+    # - passive_deletes: 메모 삭제는 DB 의 ON DELETE CASCADE 에 맡김 (삭제 전 로드 안 함)
     memories = relationship(
         "MemoryItem",
         back_populates="bundle",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
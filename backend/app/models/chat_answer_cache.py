@@ -0,0 +1,45 @@
+# app/models/chat_answer_cache.py
+
+from uuid import uuid4
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from app.core.db import Base
+from app.models.summary_cache import EMBEDDING_DIM
+
+
+class ChatAnswerCache(Base):
+    """
+    /chat 답변 semantic 캐시.
+    - 질문 임베딩과 답변을 저장해 두고, 같은 맥락(system + memory_context + history)에서
+      거의 같은 질문이 다시 오면 LLM 호출 없이 이 답변을 재사용
+    - 맥락은 context_hash 로 정확히 일치해야 하고, 질문만 임베딩 거리로 비교
+    - 유저 단위로만 검색, pgvector 확장이 필요 (없으면 테이블을 만들지 않음)
+    """
+
+    __tablename__ = "chat_answer_cache"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # 질문을 뺀 나머지 messages 의 blake2b 해시
+    context_hash = Column(String(32), nullable=False)
+    embedding = Column(Vector(EMBEDDING_DIM), nullable=False)
+    answer = Column(Text, nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
+
+    __table_args__ = (
+        # 같은 유저 + 같은 맥락으로 좁힌 뒤 정확한 거리 계산 (후보가 몇 개 안 됨)
+        Index("ix_chat_answer_cache_user_context", "user_id", "context_hash"),
+    )
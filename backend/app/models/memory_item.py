@@ -11,10 +11,11 @@ from sqlalchemy import (
     Integer,
     DateTime,
     ForeignKey,
+    Index,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 
 from app.core.db import Base
 
@@ -25,12 +26,20 @@ class MemoryItem(Base):
     # ---------- 기본 키 / FK ----------
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(PG_UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    bundle_id = Column(PG_UUID(as_uuid=True), ForeignKey("bundles.id"), nullable=True)
+    bundle_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("bundles.id", ondelete="CASCADE"),
+        nullable=True,
+    )
 
     # ---------- 내용 ----------
     title = Column(String(255), nullable=True)
     original_text = Column(Text, nullable=False)
     summary = Column(Text, nullable=True)
+    # 요약 진행 상태: None(요약 안 함) / pending / done / failed
+    summary_status = Column(String(20), nullable=True)
+    # OpenAI Batch 로 요약을 맡긴 경우 그 batch id (결과 반영 시 매칭용)
+    summary_batch_id = Column(String(64), nullable=True)
 
     source_type = Column(String(50), nullable=False, default="chat")
     source_id = Column(String(255), nullable=True)
@@ -58,9 +67,41 @@ class MemoryItem(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=text("now()"),
-        server_onupdate=text("now()"),
+        # update() 문에 SET updated_at = now() 를 자동으로 붙임 (DB 트리거 없음)
+        onupdate=text("now()"),
+    )
+
+    __table_args__ = (
+        # list_memories_for_bundle: WHERE bundle_id = ? AND (created_at, id) < cursor
+        #   ORDER BY created_at DESC, id DESC
+        Index(
+            "ix_memory_bundle_created_id",
+            "bundle_id",
+            created_at.desc(),
+            id.desc(),
+        ),
+        # /chat memory_context (번들 선택): WHERE bundle_id IN (...)
+        #   ORDER BY is_pinned DESC, usage_count DESC, created_at DESC LIMIT n
+        # - 본문(summary/original_text)은 btree 행 크기 제한에 걸릴 수 있어 INCLUDE 하지 않음
+        Index(
+            "ix_memory_bundle_rank",
+            "bundle_id",
+            is_pinned.desc(),
+            usage_count.desc(),
+            created_at.desc(),
+        ),
+        # summary batch sync: WHERE user_id = ? AND summary_batch_id = ?
+        # - 배치로 보낸 메모만 값이 있으므로 partial index (나머지 행은 인덱스에 안 들어감)
+        Index(
+            "ix_memory_user_summary_batch",
+            "user_id",
+            "summary_batch_id",
+            postgresql_where=summary_batch_id.isnot(None),
+        ),
     )
 
     # 관계
-    user = relationship("User", backref="memory_items", lazy="joined")
-    bundle = relationship("Bundle", backref="memory_items", lazy="joined")
+    # - 메모 조회마다 users/bundles 를 JOIN 하지 않도록 lazy="raise"
+    #   (필요하면 쿼리에서 options(joinedload(...)) / selectinload 로 명시)
+    user = relationship("User", backref=backref("memory_items", lazy="raise"), lazy="raise")
+    bundle = relationship("Bundle", back_populates="memories", lazy="raise")
@@ -0,0 +1,47 @@
+# app/models/summary_cache.py
+
+from uuid import uuid4
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from app.core.db import Base
+
+# text-embedding-3-small 을 dimensions=1536 으로 사용
+EMBEDDING_DIM = 1536
+
+
+class SummaryCache(Base):
+    """
+    메모 요약 semantic 캐시.
+    - 원문 임베딩과 요약을 같이 저장해 두고, 거의 같은 원문(코사인 유사도 ≥ 0.95)이
+      다시 저장되면 LLM 호출 없이 이 요약을 재사용
+    - 다른 유저의 요약이 섞이지 않도록 유저 단위로만 검색
+    - pgvector 확장이 필요 (없으면 init_db 가 이 테이블을 만들지 않고 캐시 비활성화)
+    """
+
+    __tablename__ = "summary_cache"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # 원문 blake2b 해시 (디버깅/중복 확인용)
+    text_hash = Column(String(32), nullable=False)
+    embedding = Column(Vector(EMBEDDING_DIM), nullable=False)
+    summary = Column(Text, nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
+
+    __table_args__ = (
+        # 유저별 캐시는 작아서 HNSW 대신 user_id 로 좁힌 뒤 정확한 거리 계산
+        Index("ix_summary_cache_user", "user_id"),
+    )
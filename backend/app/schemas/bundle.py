@@ -1,10 +1,10 @@
 # app/schemas/bundle.py
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # --- 요청용 (POST /bundles/) ---
@@ -33,5 +33,15 @@ class BundleOut(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True  # (= orm_mode = True)
+    model_config = ConfigDict(from_attributes=True)
+
+
+# --- 트리 응답 (GET /bundles/tree, 부모 다음에 자식이 오는 순서) ---
+class BundleTreeOut(BundleOut):
+    depth: int = 0  # 루트 번들 0, 자식은 부모 + 1
+
+
+# --- 목록 응답 (GET /bundles/, keyset 페이지네이션) ---
+class BundlePage(BaseModel):
+    items: List[BundleOut]
+    next_cursor: Optional[str] = None  # 없으면 마지막 페이지
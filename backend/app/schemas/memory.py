@@ -1,9 +1,9 @@
 # app/schemas/memory.py
 from datetime import datetime
-from typing import Optional, Literal, Any, Dict
+from typing import Optional, Literal, Any, Dict, List
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 
 class MemoryFromBlockCreate(BaseModel):
@@ -21,11 +21,16 @@ class MemoryItemOut(BaseModel):
     bundle_id: Optional[UUID]
     title: Optional[str]
     summary: Optional[str]
+    summary_status: Optional[str] = None  # pending / done / failed
     original_text: Optional[str] = None  # 원문 추가
     source_type: str
     source_id: Optional[str]
 
-    metadata: Any | None = None
+    # ORM 속성 이름은 metadata_json (DB 컬럼 "metadata"), 응답 필드 이름은 metadata
+    metadata: Any | None = Field(
+        default=None,
+        validation_alias=AliasChoices("metadata_json", "metadata"),
+    )
 
     is_pinned: bool
     usage_count: int
@@ -34,3 +39,23 @@ class MemoryItemOut(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# GET /bundles/{id}/memories (keyset 페이지네이션)
+class MemoryItemPage(BaseModel):
+    items: List[MemoryItemOut]
+    next_cursor: Optional[str] = None  # 없으면 마지막 페이지
+
+
+# POST /bundles/{id}/memories/bulk 응답
+class MemoryBulkCreateOut(BaseModel):
+    items: List[MemoryItemOut]
+    # 요약을 OpenAI Batch 로 넘겼으면 그 id (나중에 sync 엔드포인트로 결과 반영)
+    batch_id: Optional[str] = None
+
+
+# POST /bundles/summary-batches/{batch_id}/sync 응답
+class SummaryBatchSyncOut(BaseModel):
+    batch_id: str
+    status: str
+    updated: int = 0
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class UserBase(BaseModel):
@@ -25,7 +25,5 @@ class UserOut(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        # FastAPI + SQLAlchemy 연동용
-        orm_mode = True
-        from_attributes = True
+    # FastAPI + SQLAlchemy 연동용 (ORM 객체를 그대로 response_model 로 변환)
+    model_config = ConfigDict(from_attributes=True)
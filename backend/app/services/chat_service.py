@@ -1,9 +1,9 @@
 # app/services/chat_service.py
 
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List
-from datetime import datetime
 
 from app.models.bundle import Bundle
 from app.models.memory_item import MemoryItem
@@ -18,11 +18,9 @@ def build_memory_context(
     if not bundle_ids:
         return ""
 
-    bundles = (
-        db.query(Bundle)
-        .filter(Bundle.id.in_(bundle_ids), Bundle.user_id == user_id)
-        .all()
-    )
+    bundles = db.scalars(
+        select(Bundle).where(Bundle.id.in_(bundle_ids), Bundle.user_id == user_id)
+    ).all()
 
     if not bundles:
         return ""
@@ -34,9 +32,9 @@ def build_memory_context(
         if bundle.description:
             lines.append(f"- 설명: {bundle.description}")
 
-        memories = (
-            db.query(MemoryItem)
-            .filter(
+        memories = db.scalars(
+            select(MemoryItem)
+            .where(
                 MemoryItem.user_id == user_id,
                 MemoryItem.bundle_id == bundle.id,
             )
@@ -46,8 +44,7 @@ def build_memory_context(
                 MemoryItem.created_at.desc(),
             )
             .limit(per_bundle_limit)
-            .all()
-        )
+        ).all()
 
         if not memories:
             lines.append("- (저장된 메모 없음)")
@@ -68,11 +65,15 @@ def update_usage_stats(
     db: Session,
     used_memories: List[MemoryItem],
 ):
-    """사용된 메모들의 usage_count/last_used_at 업데이트."""
-    now = datetime.utcnow()
-    for m in used_memories:
-        m.usage_count = (m.usage_count or 0) + 1
-        m.last_used_at = now
+    """사용된 메모들의 usage_count/last_used_at 업데이트 (UPDATE ... WHERE id IN (...) 한 번)."""
+    if not used_memories:
+        return
+    db.execute(
+        update(MemoryItem)
+        .where(MemoryItem.id.in_([m.id for m in used_memories]))
+        .values(usage_count=MemoryItem.usage_count + 1, last_used_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
 
 
@@ -100,9 +101,9 @@ def chat_with_bundles(
 
     # 3) usage_count/last_used_at 업데이트 (선택)
     if selected_bundle_ids:
-        used_memories = (
-            db.query(MemoryItem)
-            .filter(
+        used_memories = db.scalars(
+            select(MemoryItem)
+            .where(
                 MemoryItem.user_id == user_id,
                 MemoryItem.bundle_id.in_(selected_bundle_ids),
             )
@@ -112,8 +113,7 @@ def chat_with_bundles(
                 MemoryItem.created_at.desc(),
             )
             .limit(5 * len(selected_bundle_ids))
-            .all()
-        )
+        ).all()
         update_usage_stats(db, used_memories)
 
     return answer, memory_context
@@ -11,11 +11,7 @@ def create_memory_from_block(
     data: MemoryFromBlockCreate,
 ) -> MemoryItem:
     # 1) 번들 존재 여부만 먼저 체크 (user_id는 일단 나중에)
-    bundle = (
-        db.query(Bundle)
-        .filter(Bundle.id == bundle_id)
-        .first()
-    )
+    bundle = db.get(Bundle, bundle_id)
 
     if not bundle:
         # 디버깅용으로 bundle_id, user_id도 메시지에 넣어두면 좋음
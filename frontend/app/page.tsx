@@ -7,9 +7,10 @@ import {
   debugApiBase,
   fetchBundles,
   createBundle,
-  sendChat,
+  streamChat,
   fetchMemoriesForBundle,
   saveMemoryToBundle,
+  waitForMemorySummary,
   updateBundle,
   deleteBundle,
   updateMemoryInBundle,
@@ -413,9 +414,22 @@ export default function HomePage() {
     );
   };
 
+  // 저장 직후 요약이 백그라운드에서 만들어지는 중이면(pending) 끝난 뒤 목록의 메모를 교체
+  const refreshPendingSummary = (bundleId: string, memory: MemoryItem) => {
+    if (memory.summary_status !== "pending") return;
+    waitForMemorySummary(memory).then((updated) => {
+      setBundleMemories((prev) => ({
+        ...prev,
+        [bundleId]: (prev[bundleId] ?? []).map((m) =>
+          m.id === updated.id ? updated : m,
+        ),
+      }));
+    });
+  };
+
   // -----------------------------
   // 채팅 보내기
-  //  (/chat에 선택된 메모 id만 보냄 + 자동 메모 저장)
+  //  (/chat/stream 에 선택된 메모 id만 보냄 + 자동 메모 저장)
   // -----------------------------
   const handleSendMessage = async (message: string) => {
     if (!message.trim()) return;
@@ -435,13 +449,22 @@ export default function HomePage() {
     setIsSending(true);
 
     try {
-      const res = await sendChat({
-        user_id: currentUser.id, // 지금은 백엔드가 토큰으로 유저를 알아서 찾아가니까 사실상 의미 없음
-        message,
-        history: historySlice,
-        selected_bundle_ids: [], // 스키마 맞추기용
-        selected_memory_ids: selectedMemoryIds,
-      });
+      // 답변은 토큰이 오는 대로 화면에 먼저 보여줌 (/chat/stream)
+      const res = await streamChat(
+        {
+          user_id: currentUser.id, // 지금은 백엔드가 토큰으로 유저를 알아서 찾아가니까 사실상 의미 없음
+          message,
+          history: historySlice,
+          selected_bundle_ids: [], // 스키마 맞추기용
+          selected_memory_ids: selectedMemoryIds,
+        },
+        (answerSoFar) => {
+          setMessages([
+            ...newMessages,
+            { role: "assistant", content: answerSoFar },
+          ]);
+        },
+      );
 
       const assistantMsg: ChatMessage = {
         role: "assistant",
@@ -453,6 +476,7 @@ export default function HomePage() {
       setLastMemoryContext(res.memory_context);
 
       // � auto_route 에서 새 번들을 만들 수 있으니, 번들 목록 리프레시
+      //    (자동 분류는 응답 뒤 서버 백그라운드라 새 번들은 다음 리프레시에 보일 수 있음)
       try {
         const latestBundles = await fetchBundles(currentUser.id);
         setBundles(latestBundles);
@@ -478,12 +502,13 @@ export default function HomePage() {
             ...prev,
             [currentBundleId]: [memory, ...(prev[currentBundleId] ?? [])],
           }));
+          refreshPendingSummary(currentBundleId, memory);
         } catch (err) {
           console.error("[auto-save] saveMemoryToBundle failed", err);
         }
       }
     } catch (err) {
-      console.error("sendChat failed", err);
+      console.error("streamChat failed", err);
       window.alert("채팅 전송 실패");
     } finally {
       setIsSending(false);
@@ -625,6 +650,7 @@ const handleSaveMemory = async (bundleId: string, title: string) => {
       ...prev,
       [bundleId]: [memory, ...(prev[bundleId] ?? [])],
     }));
+    refreshPendingSummary(bundleId, memory);
 
     setTextToSave("");
   } catch (err) {
@@ -211,18 +211,100 @@ export async function sendChat(
   };
 }
 
+// /chat/stream (SSE): 토큰이 올 때마다 onDelta(지금까지 받은 전체 답변)
+// - 마지막 done 이벤트에 /chat 과 같은 필드가 옴
+export async function streamChat(
+  payload: SendChatPayload,
+  onDelta: (answerSoFar: string) => void,
+): Promise<ChatApiResponse> {
+  const res = await apiFetch(`/chat/stream`, {
+    method: "POST",
+    body: JSON.stringify(payload),
+  });
+
+  if (!res.body) {
+    throw new Error("[streamChat] empty response body");
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let answer = "";
+
+  // done 이벤트를 받으면 바로 반환 (서버 쪽 저장/자동 분류는 응답 뒤 백그라운드)
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // 이벤트는 빈 줄("\n\n")로 구분
+    let sep = buffer.indexOf("\n\n");
+    while (sep !== -1) {
+      const rawEvent = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      sep = buffer.indexOf("\n\n");
+
+      for (const line of rawEvent.split("\n")) {
+        if (!line.startsWith("data: ")) continue;
+        const event = JSON.parse(line.slice(6));
+        if (event.type === "delta") {
+          answer += event.content ?? "";
+          onDelta(answer);
+        } else if (event.type === "done") {
+          reader.cancel().catch(() => {});
+          return {
+            answer: event.answer ?? answer,
+            memory_context: event.memory_context ?? "",
+            used_memories: event.used_memories ?? [],
+          };
+        }
+      }
+    }
+  }
+
+  throw new Error("[streamChat] stream ended without done event");
+}
+
 // -------------------
 // 2) /bundles 목록 조회
 // -------------------
 
+// 목록 API 는 { items, next_cursor } 페이지 단위로 내려옴 → next_cursor 가 없을 때까지 이어서 조회
+type Page<T> = {
+  items: T[];
+  next_cursor: string | null;
+};
+
+const PAGE_SIZE = 200;
+
+async function fetchAllPages<T>(path: string): Promise<T[]> {
+  const all: T[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+    if (cursor) params.set("cursor", cursor);
+
+    const res = await apiFetch(`${path}?${params.toString()}`, {
+      method: "GET",
+      cache: "no-store",
+    });
+    const page = (await res.json()) as Page<T>;
+    all.push(...(page.items ?? []));
+    cursor = page.next_cursor ?? null;
+  } while (cursor);
+
+  return all;
+}
+
 export async function fetchBundles(_userId: string) {
   // 이제 userId는 사용하지 않고, 토큰에서 유저를 식별
-  const res = await apiFetch(`/bundles/`, {
+  // 트리 API 는 전체 번들을 한 번에 (부모 → 자식 순서로) 내려줌 → 페이지 반복 조회 없음
+  const res = await apiFetch(`/bundles/tree`, {
     method: "GET",
     cache: "no-store",
   });
-
-  return res.json() as Promise<import("./types").Bundle[]>;
+  return (await res.json()) as import("./types").Bundle[];
 }
 
 // -------------------
@@ -233,13 +315,7 @@ export async function fetchMemoriesForBundle(
   bundleId: string,
 ): Promise<MemoryItem[]> {
   try {
-    const res = await apiFetch(`/bundles/${bundleId}/memories`, {
-      method: "GET",
-      cache: "no-store",
-    });
-
-    const data = await res.json();
-    return (data ?? []) as MemoryItem[];
+    return await fetchAllPages<MemoryItem>(`/bundles/${bundleId}/memories`);
   } catch (err) {
     console.warn("[fetchMemoriesForBundle] error", err);
     return [];
@@ -327,6 +403,37 @@ export async function saveMemoryToBundle(
   return (await res.json()) as MemoryItem;
 }
 
+export async function fetchMemoryInBundle(
+  bundleId: string,
+  memoryId: string,
+): Promise<MemoryItem> {
+  const res = await apiFetch(`/bundles/${bundleId}/memories/${memoryId}`);
+  return (await res.json()) as MemoryItem;
+}
+
+// 저장 직후 summary_status 가 pending 이면, 요약이 끝날 때까지 잠깐씩 다시 조회
+const SUMMARY_POLL_INTERVAL_MS = 1500;
+const SUMMARY_POLL_MAX_TRIES = 20;
+
+export async function waitForMemorySummary(
+  memory: MemoryItem,
+): Promise<MemoryItem> {
+  if (memory.summary_status !== "pending" || !memory.bundle_id) return memory;
+
+  let latest = memory;
+  for (let i = 0; i < SUMMARY_POLL_MAX_TRIES; i++) {
+    await new Promise((r) => setTimeout(r, SUMMARY_POLL_INTERVAL_MS));
+    try {
+      latest = await fetchMemoryInBundle(memory.bundle_id, memory.id);
+    } catch (err) {
+      console.warn("[waitForMemorySummary] error", err);
+      return latest;
+    }
+    if (latest.summary_status !== "pending") return latest;
+  }
+  return latest;
+}
+
 // -------------------
 // 5) 번들 생성
 // -------------------
@@ -378,11 +485,10 @@ export async function updateBundle(
 }
 
 export async function deleteBundle(bundleId: string) {
-  const res = await apiFetch(`/bundles/${bundleId}`, {
+  // 204 No Content (응답 바디 없음)
+  await apiFetch(`/bundles/${bundleId}`, {
     method: "DELETE",
   });
-
-  return await res.json();
 }
 
 // -------------------
@@ -412,11 +518,10 @@ export async function deleteMemoryInBundle(
   bundleId: string,
   memoryId: string,
 ) {
-  const res = await apiFetch(`/bundles/${bundleId}/memories/${memoryId}`, {
+  // 204 No Content (응답 바디 없음)
+  await apiFetch(`/bundles/${bundleId}/memories/${memoryId}`, {
     method: "DELETE",
   });
-
-  return await res.json();
 }
 
 // -------------------
@@ -26,6 +26,8 @@ export type MemoryItem = {
   title?: string | null;
   original_text?: string | null;
   summary?: string | null;
+  // 백그라운드 요약 상태 (pending → done / failed)
+  summary_status?: "pending" | "done" | "failed" | null;
   source_type: string;
   source_id?: string | null;
   metadata?: any;